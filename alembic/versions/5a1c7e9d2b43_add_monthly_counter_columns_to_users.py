@@ -0,0 +1,93 @@
+"""Add monthly counter columns to users.
+
+Revision ID: 5a1c7e9d2b43
+Revises: 0c309fb6c471
+Create Date: 2026-10-16 09:12:44.120318
+
+"""
+
+from datetime import datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "5a1c7e9d2b43"
+down_revision: Union[str, Sequence[str], None] = "0c309fb6c471"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    columns = [x["name"] for x in inspector.get_columns("users")]
+
+    if "month_key" in columns:
+        return
+
+    op.add_column("users", sa.Column("month_key", sa.Integer(), nullable=True))
+    op.add_column(
+        "users",
+        sa.Column("month_seconds", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "users",
+        sa.Column("month_files", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill the counters for the current month from the jobs table, with
+    # the same filter as the job based quota check the counters replace.
+    now = datetime.utcnow()
+    first_day_this_month = datetime(now.year, now.month, 1)
+
+    users = sa.table(
+        "users",
+        sa.column("user_id"),
+        sa.column("month_key"),
+        sa.column("month_seconds"),
+        sa.column("month_files"),
+    )
+    jobs = sa.table(
+        "jobs",
+        sa.column("user_id"),
+        sa.column("status"),
+        sa.column("job_type"),
+        sa.column("created_at"),
+        sa.column("transcribed_seconds"),
+    )
+    transcribed = sa.and_(
+        jobs.c.user_id == users.c.user_id,
+        jobs.c.created_at >= first_day_this_month,
+        jobs.c.status.in_(["COMPLETED", "DELETED"]),
+        jobs.c.job_type == "TRANSCRIPTION",
+    )
+
+    op.execute(
+        users.update().values(
+            month_key=now.year * 100 + now.month,
+            month_seconds=sa.select(
+                sa.func.coalesce(sa.func.sum(jobs.c.transcribed_seconds), 0)
+            )
+            .where(transcribed)
+            .scalar_subquery(),
+            month_files=sa.select(sa.func.count()).where(transcribed).scalar_subquery(),
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    columns = [x["name"] for x in inspector.get_columns("users")]
+
+    for column in ("month_files", "month_seconds", "month_key"):
+        if column in columns:
+            op.drop_column("users", column)
@@ -0,0 +1,55 @@
+"""Convert users.transcribed_seconds to BIGINT.
+
+Revision ID: 7d2e4b8c1f05
+Revises: 5a1c7e9d2b43
+Create Date: 2026-10-16 10:03:27.551842
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2e4b8c1f05"
+down_revision: Union[str, Sequence[str], None] = "5a1c7e9d2b43"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    columns = {x["name"]: x["type"] for x in inspector.get_columns("users")}
+
+    if isinstance(columns.get("transcribed_seconds"), sa.BigInteger):
+        return
+
+    op.execute(
+        "UPDATE users SET transcribed_seconds = 0 WHERE transcribed_seconds IS NULL"
+    )
+    op.alter_column(
+        "users",
+        "transcribed_seconds",
+        type_=sa.BigInteger(),
+        existing_nullable=True,
+        postgresql_using="transcribed_seconds::bigint",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.alter_column(
+        "users",
+        "transcribed_seconds",
+        type_=sa.Integer(),
+        existing_type=sa.BigInteger(),
+        existing_nullable=True,
+        postgresql_using="transcribed_seconds::integer",
+    )
@@ -0,0 +1,49 @@
+"""Add partial index for queued jobs.
+
+Revision ID: 9b3f6a2d4e17
+Revises: 7d2e4b8c1f05
+Create Date: 2026-10-16 10:41:09.318274
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3f6a2d4e17"
+down_revision: Union[str, Sequence[str], None] = "7d2e4b8c1f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    indexes = [x["name"] for x in inspector.get_indexes("jobs")]
+
+    if "ix_jobs_queued_status" in indexes:
+        return
+
+    op.create_index(
+        "ix_jobs_queued_status",
+        "jobs",
+        ["status"],
+        postgresql_where=sa.text("status IN ('UPLOADED', 'IN_PROGRESS')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    indexes = [x["name"] for x in inspector.get_indexes("jobs")]
+
+    if "ix_jobs_queued_status" in indexes:
+        op.drop_index("ix_jobs_queued_status", table_name="jobs")
@@ -0,0 +1,51 @@
+"""Add status to the jobs user_id and created_at index.
+
+Revision ID: a8d4f1b6c390
+Revises: f3a7c2e9d514
+Create Date: 2026-10-16 16:12:38.905127
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d4f1b6c390"
+down_revision: Union[str, Sequence[str], None] = "f3a7c2e9d514"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    indexes = [x["name"] for x in inspector.get_indexes("jobs")]
+
+    if "ix_jobs_user_id_created_at_status" not in indexes:
+        op.create_index(
+            "ix_jobs_user_id_created_at_status",
+            "jobs",
+            ["user_id", "created_at", "status"],
+        )
+
+    # The new index covers the same leading columns.
+    if "ix_jobs_user_id_created_at" in indexes:
+        op.drop_index("ix_jobs_user_id_created_at", table_name="jobs")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    indexes = [x["name"] for x in inspector.get_indexes("jobs")]
+
+    if "ix_jobs_user_id_created_at" not in indexes:
+        op.create_index("ix_jobs_user_id_created_at", "jobs", ["user_id", "created_at"])
+
+    if "ix_jobs_user_id_created_at_status" in indexes:
+        op.drop_index("ix_jobs_user_id_created_at_status", table_name="jobs")
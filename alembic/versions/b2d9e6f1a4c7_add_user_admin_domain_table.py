@@ -0,0 +1,80 @@
+"""Add user_admin_domain table.
+
+Revision ID: b2d9e6f1a4c7
+Revises: a8d4f1b6c390
+Create Date: 2026-10-16 19:02:51.640217
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d9e6f1a4c7"
+down_revision: Union[str, Sequence[str], None] = "a8d4f1b6c390"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+
+    if "user_admin_domain" not in inspector.get_table_names():
+        op.create_table(
+            "user_admin_domain",
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("domain", sa.String(), nullable=False),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("user_id", "domain"),
+        )
+
+    indexes = [x["name"] for x in inspect(engine).get_indexes("user_admin_domain")]
+
+    if "ix_user_admin_domain_domain" not in indexes:
+        op.create_index(
+            "ix_user_admin_domain_domain", "user_admin_domain", ["domain"], unique=False
+        )
+
+    # The table may already have been created, empty, by create_all() on
+    # startup. Always rebuild its rows from the comma separated
+    # admin_domains column.
+    users = sa.table("users", sa.column("id"), sa.column("admin_domains"))
+    user_admin_domain = sa.table(
+        "user_admin_domain", sa.column("user_id"), sa.column("domain")
+    )
+    rows = []
+
+    for user_id, admin_domains in engine.execute(
+        sa.select(users.c.id, users.c.admin_domains).where(
+            users.c.admin_domains.isnot(None)
+        )
+    ):
+        domains = {
+            domain.strip().lower()
+            for domain in admin_domains.split(",")
+            if domain.strip()
+        }
+        rows.extend({"user_id": user_id, "domain": domain} for domain in domains)
+
+    op.execute(user_admin_domain.delete())
+
+    if rows:
+        op.bulk_insert(user_admin_domain, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+
+    if "user_admin_domain" in inspector.get_table_names():
+        op.drop_index("ix_user_admin_domain_domain", table_name="user_admin_domain")
+        op.drop_table("user_admin_domain")
@@ -0,0 +1,42 @@
+"""Add composite index on jobs user_id and created_at.
+
+Revision ID: c4e8a1f7b962
+Revises: 9b3f6a2d4e17
+Create Date: 2026-10-16 12:22:51.704163
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8a1f7b962"
+down_revision: Union[str, Sequence[str], None] = "9b3f6a2d4e17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    indexes = [x["name"] for x in inspector.get_indexes("jobs")]
+
+    if "ix_jobs_user_id_created_at" in indexes:
+        return
+
+    op.create_index("ix_jobs_user_id_created_at", "jobs", ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    indexes = [x["name"] for x in inspector.get_indexes("jobs")]
+
+    if "ix_jobs_user_id_created_at" in indexes:
+        op.drop_index("ix_jobs_user_id_created_at", table_name="jobs")
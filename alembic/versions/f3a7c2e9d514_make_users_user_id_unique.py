@@ -0,0 +1,50 @@
+"""Make the users user_id index unique.
+
+Revision ID: f3a7c2e9d514
+Revises: c4e8a1f7b962
+Create Date: 2026-10-16 15:04:12.318406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a7c2e9d514"
+down_revision: Union[str, Sequence[str], None] = "c4e8a1f7b962"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    indexes = {x["name"]: x for x in inspector.get_indexes("users")}
+
+    if "ix_users_user_id" in indexes:
+        if indexes["ix_users_user_id"]["unique"]:
+            return
+
+        op.drop_index("ix_users_user_id", table_name="users")
+
+    op.create_index("ix_users_user_id", "users", ["user_id"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    engine = op.get_bind()
+    inspector = inspect(engine)
+    indexes = {x["name"]: x for x in inspector.get_indexes("users")}
+
+    if "ix_users_user_id" in indexes:
+        if not indexes["ix_users_user_id"]["unique"]:
+            return
+
+        op.drop_index("ix_users_user_id", table_name="users")
+
+    op.create_index("ix_users_user_id", "users", ["user_id"])
@@ -2,9 +2,11 @@ import requests
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi_utils.tasks import repeat_every
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.types import Receive, Scope, Send
 
 from auth.oidc import RefreshToken, oauth, verify_user
 
@@ -35,6 +37,24 @@ log = get_logger()
 
 log.info(f"Starting API: {settings.API_TITLE} {settings.API_VERSION}")
 
+
+class AdminGZipMiddleware(GZipMiddleware):
+    """
+    Compress the responses of the admin endpoints.
+    The user, group and customer lists repeat the same keys on every row and
+    compress well, while media and result files elsewhere must be sent as is
+    to keep range requests working.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(
+            f"{settings.API_PREFIX}/admin"
+        ):
+            await super().__call__(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
@@ -78,6 +98,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(AdminGZipMiddleware, minimum_size=1024, compresslevel=5)
 app.add_middleware(SessionMiddleware, settings.API_SECRET_KEY, https_only=False)
 app.include_router(transcriber_router, prefix=settings.API_PREFIX, tags=["transcriber"])
 app.include_router(job_router, prefix=settings.API_PREFIX, tags=["job"])
@@ -207,7 +228,7 @@ async def refresh(request: Request, refresh_token: RefreshToken):
         refresh_token (RefreshToken): The refresh token model.
 
     Returns:
-        JSONResponse: The new access token.
+        ORJSONResponse: The new access token.
     """
 
     data = {
@@ -224,9 +245,9 @@ async def refresh(request: Request, refresh_token: RefreshToken):
         )
         response.raise_for_status()
     except Exception:
-        return JSONResponse({"error": "Failed to refresh token"}, status_code=400)
+        return ORJSONResponse({"error": "Failed to refresh token"}, status_code=400)
 
-    return JSONResponse({"access_token": response.json()["access_token"]})
+    return ORJSONResponse({"access_token": response.json()["access_token"]})
 
 
 @app.get("/api/docs")
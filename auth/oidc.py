@@ -142,10 +142,9 @@ async def verify_token(id_token: str) -> dict:
 async def verify_user(request: Request, admin: Optional[bool] = False) -> str:
     """
     Verify the user from the request.
-    1. Extract the ID token from the Authorization header.
-    2. Verify the ID token.
-    3. Create or update the user in the database.
-    4. Return the user ID.
+    1. Verify the ID token and create or update the user, once per request.
+    2. Check that the user is active, and an admin if required.
+    3. Return the user.
 
     Parameters:
         request (Request): The incoming HTTP request.
@@ -154,6 +153,40 @@ async def verify_user(request: Request, admin: Optional[bool] = False) -> str:
         str: The verified user ID.
     """
 
+    # The user may already have been verified by another dependency of the
+    # same request, only the access checks below have to be repeated.
+    if (user := getattr(request.state, "user", None)) is None:
+        user = await verify_request_user(request)
+        request.state.user = user
+
+    user_id = user["user_id"]
+
+    # Check if the user is active
+    if not user["active"]:
+        log.error(f"User {user_id} is not active.")
+        raise HTTPException(status_code=403, detail="User is not active.")
+
+    if admin and not user["admin"]:
+        log.error(f"User {user_id} is not an admin.")
+        raise HTTPException(status_code=403, detail="User is not an admin.")
+
+    if not admin:
+        log.info(f"User {user_id} authenticated successfully.")
+
+    return user
+
+
+async def verify_request_user(request: Request) -> dict:
+    """
+    Verify the ID token of the request and create or update its user.
+
+    Parameters:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        dict: The user.
+    """
+
     # Check if the Authorization header is present
     if not (auth_header := request.headers.get("Authorization")):
         raise UnauthenticatedError("No authorization header found.")
@@ -173,23 +206,9 @@ async def verify_user(request: Request, admin: Optional[bool] = False) -> str:
     username = decoded_jwt.get("preferred_username")
     realm = decoded_jwt.get("realm", username.split("@")[-1])
 
-    user = user_create(
+    return user_create(
         username=username,
         realm=realm,
         user_id=user_id,
         email=decoded_jwt.get("email", ""),
     )
-
-    # Check if the user is active
-    if not user["active"]:
-        log.error(f"User {user_id} is not active.")
-        raise HTTPException(status_code=403, detail="User is not active.")
-
-    if admin and not user["admin"]:
-        log.error(f"User {user_id} is not an admin.")
-        raise HTTPException(status_code=403, detail="User is not an admin.")
-
-    if not admin:
-        log.info(f"User {user_id} authenticated successfully.")
-
-    return user
@@ -3,16 +3,58 @@ import io
 
 from datetime import datetime, timedelta
 
-from db.job import job_get_all
-from db.models import Customer, User
+from db.models import Customer, Job, JobStatusEnum, JobType, User
 from db.session import get_session
+from sqlalchemy import func, or_
 from typing import Optional
+from utils.cache import Cache
 from utils.log import get_logger
 from utils.settings import get_settings
 
 settings = get_settings()
 log = get_logger()
 
+# Customer names by partner ID, customers rarely change. Cleared whenever a
+# customer is created, updated or deleted.
+partner_names_cache = Cache(maxsize=1, ttl=settings.API_CACHE_TTL)
+
+# CSV exports by the admins access level, the statistics in them may be
+# as stale as the other cached statistics. Also cleared whenever a customer
+# is created, updated or deleted.
+export_cache = Cache(maxsize=256, ttl=settings.API_STATISTICS_CACHE_TTL)
+
+# Realms of all users, only changes when a user from a new realm logs in
+# for the first time.
+realms_cache = Cache(maxsize=1, ttl=settings.API_CACHE_TTL)
+
+# Column headers of the customer CSV export.
+CSV_FIELDNAMES = (
+    "Customer Name",
+    "Customer Abbreviation",
+    "Partner ID",
+    "Contact Email",
+    "Price Plan",
+    "Base Fee",
+    "Blocks Purchased",
+    "Realms",
+    "Total Users",
+    "Files (This Month)",
+    "Files (Last Month)",
+    "Total minutes (This Month)",
+    "Total minutes (Last Month)",
+    "Minutes via Sunet Play (This Month)",
+    "Minutes via Sunet Play (Last Month)",
+    "Minutes via web interface and API (This Month)",
+    "Minutes via web interface and API (Last Month)",
+    "Blocks Consumed",
+    "Minutes Included",
+    "Overage Minutes",
+    "Overage Minutes (Last Month)",
+    "Remaining Minutes",
+    "Notes",
+    "Created At",
+)
+
 
 def customer_create(
     customer_abbr: str,
@@ -61,41 +103,67 @@ def customer_create(
 
         log.info(f"Customer {customer.name} created with ID {customer.id}.")
 
-        return customer.as_dict()
+        customer_dict = customer.as_dict()
+
+    partner_names_cache.clear()
+    export_cache.clear()
+
+    return customer_dict
 
 
-def customer_get_from_user_id(user_id: str) -> Optional[dict]:
+def customer_names_from_user_ids(user_ids: list[str]) -> dict:
     """
-    Get a customer by user_id.
+    Get the customer names for several users at once.
+    A user belongs to the first customer whose realms contain the user's
+    realm.
 
     Parameters:
-        user_id (str): The user ID to retrieve the associated customer.
+        user_ids (list[str]): The user IDs to look up.
 
     Returns:
-        Optional[dict]: Dictionary representation of the customer if found, else empty dict.
+        dict: Customer name by user ID, "None" for users without a customer.
     """
 
-    with get_session() as session:
-        if not (user := session.query(User).filter(User.user_id == user_id).first()):
-            return {}
+    names = {user_id: "None" for user_id in user_ids}
 
-        realm = user.realm
+    with get_session() as session:
+        user_realms = (
+            session.query(User.user_id, User.realm)
+            .filter(User.user_id.in_(names.keys()))
+            .all()
+        )
 
-        if not (
-            customer := (
-                session.query(Customer)
-                .filter(Customer.realms.like(f"%{realm}%"))
-                .first()
+        if not user_realms:
+            return names
+
+        customers = (
+            session.query(Customer.name, Customer.realms)
+            .filter(
+                or_(
+                    *(
+                        Customer.realms.like(f"%{realm}%")
+                        for realm in {row.realm for row in user_realms}
+                    )
+                )
             )
-        ):
-            return {}
+            .all()
+        )
 
-        return customer.as_dict()
+    for user_id, realm in user_realms:
+        for customer in customers:
+            if realm in (customer.realms or ""):
+                names[user_id] = customer.name
+                break
+
+    return names
 
 
 def customer_get(customer_id: str) -> Optional[dict]:
     """
     Get a customer by id.
+    Not cached, a per-process cache would keep showing a customer that
+    another worker has updated or deleted. It is a primary key lookup and
+    only used by the customer details view.
 
     Parameters:
         customer_id (str): The ID of the customer to retrieve.
@@ -105,16 +173,32 @@ def customer_get(customer_id: str) -> Optional[dict]:
     """
 
     with get_session() as session:
-        if not (
-            customer := session.query(Customer)
-            .filter(Customer.id == customer_id)
-            .first()
-        ):
+        if not (customer := session.get(Customer, customer_id)):
             return {}
 
         return customer.as_dict()
 
 
+def customer_get_partner_names() -> dict:
+    """
+    Get the customer names by partner ID. Used to show REACH users, which
+    have the partner ID as username, with their customer name.
+
+    Returns:
+        dict: A dictionary mapping partner IDs to customer names.
+    """
+
+    if (partner_names := partner_names_cache.get("partner_names")) is not None:
+        return partner_names
+
+    with get_session() as session:
+        partner_names = dict(session.query(Customer.partner_id, Customer.name).all())
+
+    partner_names_cache.set("partner_names", partner_names)
+
+    return partner_names
+
+
 def customer_get_by_partner_id(partner_id: str) -> Optional[dict]:
     """
     Get a customer by partner_id.
@@ -205,12 +289,7 @@ def customer_update(
     """
 
     with get_session() as session:
-        if not (
-            customer := session.query(Customer)
-            .filter(Customer.id == customer_id)
-            .with_for_update()
-            .first()
-        ):
+        if not (customer := session.get(Customer, customer_id, with_for_update=True)):
             return {}
 
         if customer_abbr is not None:
@@ -234,7 +313,12 @@ def customer_update(
 
         log.info(f"Customer {customer.name} (ID: {customer.id}) updated.")
 
-        return customer.as_dict()
+        customer_dict = customer.as_dict()
+
+    partner_names_cache.clear()
+    export_cache.clear()
+
+    return customer_dict
 
 
 def customer_delete(customer_id: int) -> bool:
@@ -248,62 +332,106 @@ def customer_delete(customer_id: int) -> bool:
         bool: True if the customer was deleted, False if not found.
     """
     with get_session() as session:
-        if not (
-            customer := session.query(Customer)
-            .filter(Customer.id == customer_id)
-            .first()
-        ):
+        if not (customer := session.get(Customer, customer_id)):
             return False
 
         session.delete(customer)
 
+    partner_names_cache.clear()
+    export_cache.clear()
+
     log.info(f"Customer {customer.name} (ID: {customer.id}) deleted.")
 
     return True
 
 
-def customer_get_statistics(customer_id: str) -> dict:
+def customer_get_statistics_bulk(customer_ids: list) -> dict:
     """
-    Get statistics for a specific customer.
-    Calculates transcription statistics for all users in the customer's realms.
-    For fixed plan customers, calculates block usage and overages.
+    Get statistics for several customers at once.
+    Calculates transcription statistics for all users in the customers'
+    realms, and block usage and overages for fixed plan customers. The
+    users of all customers are loaded with one query and their jobs are
+    summed up by one grouped query.
 
     Parameters:
-        customer_id (str): The ID of the customer to get statistics for.
+        customer_ids (list): The IDs of the customers to get statistics for.
 
     Returns:
-        dict: Dictionary containing customer statistics.
+        dict: Customer statistics keyed by the customer ID as a string.
+            Customers which are not found are left out.
     """
 
+    today = datetime.utcnow().date()
+    first_day_this_month = today.replace(day=1)
+    last_day_prev_month = first_day_this_month - timedelta(days=1)
+    first_day_prev_month = last_day_prev_month.replace(day=1)
+
+    customer_stats = {}
+
     with get_session() as session:
-        if not (
-            customer := session.query(Customer)
-            .filter(Customer.id == customer_id)
-            .first()
-        ):
-            return {
-                "total_users": 0,
-                "transcribed_files": 0,
-                "transcribed_files_last_month": 0,
-                "transcribed_minutes": 0,
-                "transcribed_minutes_external": 0,
-                "transcribed_minutes_last_month": 0,
-                "transcribed_minutes_external_last_month": 0,  # REACH etc
-                "total_transcribed_minutes": 0,
-                "total_transcribed_minutes_last_month": 0,
-                "blocks_purchased": 0,
-                "blocks_consumed": 0,
-                "minutes_included": 0,
-                "overage_minutes": 0,
-                "overage_minutes_last_month": 0,
-                "remaining_minutes": 0,
-            }
+        customers = (
+            session.query(
+                Customer.id,
+                Customer.realms,
+                Customer.partner_id,
+                Customer.priceplan,
+                Customer.blocks_purchased,
+            )
+            .filter(Customer.id.in_(customer_ids))
+            .all()
+        )
+
+        realms_by_customer = {
+            customer.id: [r.strip() for r in customer.realms.split(",") if r.strip()]
+            for customer in customers
+        }
+        all_realms = {
+            realm for realm_list in realms_by_customer.values() for realm in realm_list
+        }
+        partner_ids = {customer.partner_id for customer in customers}
+
+        # All users of all customers, either by realm or by partner ID.
+        users_query = session.query(User.user_id, User.username, User.realm).filter(
+            User.realm.in_(all_realms) | User.username.in_(partner_ids)
+        )
+        users = users_query.all()
+
+        users_by_realm = {}
+        users_by_username = {}
+
+        for user in users:
+            users_by_realm.setdefault(user.realm, []).append(user)
+            users_by_username.setdefault(user.username, []).append(user)
+
+        # Transcribed files and seconds per user for the previous and the
+        # current month.
+        this_month = Job.created_at >= first_day_this_month
+        totals = {}
+
+        jobs_per_user = (
+            session.query(
+                Job.user_id,
+                this_month.label("this_month"),
+                func.count(Job.id),
+                func.coalesce(func.sum(Job.transcribed_seconds), 0),
+            )
+            .filter(Job.user_id.in_(users_query.with_entities(User.user_id)))
+            .filter(Job.job_type == JobType.TRANSCRIPTION)
+            .filter(Job.status.in_([JobStatusEnum.COMPLETED, JobStatusEnum.DELETED]))
+            .filter(Job.created_at >= first_day_prev_month)
+            .group_by(Job.user_id, this_month)
+        )
+
+        for job_user_id, is_this_month, files, seconds in jobs_per_user:
+            totals[(job_user_id, bool(is_this_month))] = (files, seconds)
+
+    for customer in customers:
+        blocks_purchased = customer.blocks_purchased if customer.blocks_purchased else 0
+        minutes_included = blocks_purchased * settings.CUSTOMER_MINUTES_PER_BLOCK
 
         # Get all users associated with this customer's realms
-        if not (
-            realm_list := [r.strip() for r in customer.realms.split(",") if r.strip()]
-        ):
-            return {
+        if not (realm_list := realms_by_customer[customer.id]):
+            customer_stats[str(customer.id)] = {
                 "total_users": 0,
                 "transcribed_files": 0,
                 "transcribed_minutes": 0,
@@ -313,29 +441,19 @@ def customer_get_statistics(customer_id: str) -> dict:
                 "transcribed_files_last_month": 0,
                 "total_transcribed_minutes": 0,
                 "total_transcribed_minutes_last_month": 0,
-                "blocks_purchased": (
-                    customer.blocks_purchased if customer.blocks_purchased else 0
-                ),
+                "blocks_purchased": blocks_purchased,
                 "blocks_consumed": 0,
-                "minutes_included": (
-                    customer.blocks_purchased if customer.blocks_purchased else 0
-                )
-                * settings.CUSTOMER_MINUTES_PER_BLOCK,
+                "minutes_included": minutes_included,
                 "overage_minutes": 0,
                 "overage_minutes_last_month": 0,
-                "remaining_minutes": (
-                    customer.blocks_purchased if customer.blocks_purchased else 0
-                )
-                * settings.CUSTOMER_MINUTES_PER_BLOCK,
+                "remaining_minutes": minutes_included,
             }
+            continue
 
-        users = session.query(User).filter(User.realm.in_(realm_list)).all()
-
-        partner_users = (
-            session.query(User).filter(User.username == customer.partner_id).all()
-        )
-
-        users.extend(partner_users)
+        customer_users = [
+            user for realm in set(realm_list) for user in users_by_realm.get(realm, [])
+        ]
+        customer_users.extend(users_by_username.get(customer.partner_id, []))
 
         transcribed_minutes = 0
         transcribed_minutes_external = 0
@@ -347,54 +465,28 @@ def customer_get_statistics(customer_id: str) -> dict:
         total_files_current = 0
         total_files_last = 0
 
-        today = datetime.utcnow().date()
-        first_day_this_month = today.replace(day=1)
-        last_day_prev_month = first_day_this_month - timedelta(days=1)
-        first_day_prev_month = last_day_prev_month.replace(day=1)
-
-        for user in users:
-            jobs_result = job_get_all(user.user_id, cleaned=True)
-
-            if not jobs_result or "jobs" not in jobs_result:
-                continue
-
-            jobs = jobs_result["jobs"]
-
-            for job in jobs:
-                try:
-                    job_date = datetime.strptime(
-                        job["created_at"], "%Y-%m-%d %H:%M:%S.%f"
-                    ).date()
-                except (ValueError, KeyError):
-                    continue
+        for user in customer_users:
+            files, seconds = totals.get((user.user_id, True), (0, 0))
 
-                if job.get("status") == "completed" or job.get("status") == "deleted":
-                    transcribed_seconds = job.get("transcribed_seconds", 0)
+            total_files_current += files
+            total_transcribed_minutes_current += seconds / 60
 
-                    if job_date >= first_day_this_month:
-                        total_files_current += 1
-                        total_transcribed_minutes_current += transcribed_seconds / 60
+            if user.username.isnumeric():
+                transcribed_minutes_external += seconds / 60
+            else:
+                transcribed_minutes += seconds / 60
 
-                        if user.username.isnumeric():
-                            transcribed_minutes_external += transcribed_seconds / 60
-                        else:
-                            transcribed_minutes += transcribed_seconds / 60
+            files, seconds = totals.get((user.user_id, False), (0, 0))
 
-                    elif first_day_prev_month <= job_date <= last_day_prev_month:
-                        total_files_last += 1
-                        total_transcribed_minutes_last += transcribed_seconds / 60
+            total_files_last += files
+            total_transcribed_minutes_last += seconds / 60
 
-                        if user.username.isnumeric():
-                            transcribed_minutes_external_last_month += (
-                                transcribed_seconds / 60
-                            )
-                        else:
-                            transcribed_minutes_last_month += transcribed_seconds / 60
+            if user.username.isnumeric():
+                transcribed_minutes_external_last_month += seconds / 60
+            else:
+                transcribed_minutes_last_month += seconds / 60
 
         # Calculate block usage for fixed plan customers
-        blocks_purchased = customer.blocks_purchased if customer.blocks_purchased else 0
-        minutes_included = blocks_purchased * settings.CUSTOMER_MINUTES_PER_BLOCK
-
         blocks_consumed = 0
         overage_minutes = 0
         overage_minutes_last_month = 0
@@ -418,8 +510,8 @@ def customer_get_statistics(customer_id: str) -> dict:
                     4000 * blocks_purchased
                 )
 
-        return {
-            "total_users": len(users),
+        customer_stats[str(customer.id)] = {
+            "total_users": len(customer_users),
             "transcribed_files": int(total_files_current),
             "transcribed_files_last_month": int(total_files_last),
             "transcribed_minutes": int(transcribed_minutes),
@@ -438,11 +530,13 @@ def customer_get_statistics(customer_id: str) -> dict:
             "remaining_minutes": int(remaining_minutes),
         }
 
+    return customer_stats
+
 
 def get_all_realms() -> list[str]:
     """
     Get all unique realms from users.
-    Returns a sorted list of unique realm strings.
+    Returns a sorted list of unique realm strings, cached for a short while.
 
     Parameters:
         None
@@ -450,11 +544,16 @@ def get_all_realms() -> list[str]:
     Returns:
         list[str]: Sorted list of unique realms.
     """
+    if (realm_list := realms_cache.get("realms")) is not None:
+        return list(realm_list)
+
     with get_session() as session:
         realms = session.query(User.realm).distinct().all()
-        realm_list = [realm[0] for realm in realms if realm[0]]
+        realm_list = sorted(realm[0] for realm in realms if realm[0])
+
+    realms_cache.set("realms", realm_list)
 
-        return sorted(realm_list)
+    return list(realm_list)
 
 
 def get_customer_name_from_realm(realm: str) -> Optional[str]:
@@ -540,44 +639,26 @@ def export_customers_to_csv(admin_user: dict) -> str:
         CSV string with customer data and statistics
     """
 
+    # The export only depends on which customers the admin can see.
+    key = (admin_user["bofh"], admin_user["admin"], admin_user["realm"])
+
+    if (csv_data := export_cache.get(key)) is not None:
+        return csv_data
+
     output = io.StringIO()
 
     if not (customers := customer_get_all(admin_user)):
         return ""
 
-    # Define CSV headers
-    fieldnames = [
-        "Customer Name",
-        "Customer Abbreviation",
-        "Partner ID",
-        "Contact Email",
-        "Price Plan",
-        "Base Fee",
-        "Blocks Purchased",
-        "Realms",
-        "Total Users",
-        "Files (This Month)",
-        "Files (Last Month)",
-        "Total minutes (This Month)",
-        "Total minutes (Last Month)",
-        "Minutes via Sunet Play (This Month)",
-        "Minutes via Sunet Play (Last Month)",
-        "Minutes via web interface and API (This Month)",
-        "Minutes via web interface and API (Last Month)",
-        "Blocks Consumed",
-        "Minutes Included",
-        "Overage Minutes",
-        "Overage Minutes (Last Month)",
-        "Remaining Minutes",
-        "Notes",
-        "Created At",
-    ]
-
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
+    writer = csv.DictWriter(output, fieldnames=CSV_FIELDNAMES)
     writer.writeheader()
 
+    stats_by_id = customer_get_statistics_bulk(
+        [customer["id"] for customer in customers]
+    )
+
     for customer in customers:
-        stats = customer_get_statistics(customer["id"])
+        stats = stats_by_id.get(str(customer["id"]), {})
 
         row = {
             "Customer Name": customer.get("name", ""),
@@ -618,4 +699,7 @@ def export_customers_to_csv(admin_user: dict) -> str:
 
         writer.writerow(row)
 
-    return output.getvalue()
+    csv_data = output.getvalue()
+    export_cache.set(key, csv_data)
+
+    return csv_data
@@ -1,7 +1,9 @@
-from db.customer import customer_get_from_user_id
+from db.customer import customer_names_from_user_ids
 from db.models import Group, GroupModelLink, GroupUserLink, User
 from db.session import get_session
-from sqlalchemy import or_
+from db.user import user_admin_domains_split
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import selectinload
 from typing import Optional
 
 from utils.log import get_logger
@@ -67,7 +69,7 @@ def group_get(group_id: str, realm: str, user_id: Optional[str] = "") -> Optiona
         else:
             if realm == "*":
                 # Admin requesting from all realms
-                group = session.query(Group).filter(Group.id == group_id).first()
+                group = session.get(Group, group_id)
             else:
                 # Check if user has access to the group
                 admin_domains = (
@@ -84,9 +86,7 @@ def group_get(group_id: str, realm: str, user_id: Optional[str] = "") -> Optiona
                         or_(
                             Group.users.any(User.user_id == user_id),
                             Group.owner_user_id == user_id,
-                            Group.realm.in_(
-                                [domain.strip() for domain in admin_domains.split(",")]
-                            ),
+                            Group.realm.in_(user_admin_domains_split(admin_domains)),
                         )
                     )
                     .first()
@@ -115,11 +115,7 @@ def group_get(group_id: str, realm: str, user_id: Optional[str] = "") -> Optiona
             other_users = (
                 session.query(User)
                 .filter(~User.groups.any(Group.id == group_id))
-                .filter(
-                    User.realm.in_(
-                        [domain.strip() for domain in admin_domains.split(",")]
-                    )
-                )
+                .filter(User.realm.in_(user_admin_domains_split(admin_domains)))
                 .all()
             )
         group_dict = group.as_dict()
@@ -167,7 +163,6 @@ def group_get_all(user_id: str, realm: str) -> list[dict]:
         list[dict]: A list of groups with their metadata.
     """
 
-    all_users = []
     groups_list = []
 
     if realm == "*":
@@ -182,6 +177,7 @@ def group_get_all(user_id: str, realm: str) -> list[dict]:
             "users": [],
             "models": [],
             "nr_users": 0,
+            "customer_name": "None",
         }
 
         groups_list.append(default_group)
@@ -191,37 +187,48 @@ def group_get_all(user_id: str, realm: str) -> list[dict]:
             session.query(User.admin_domains).filter(User.user_id == user_id).scalar()
         )
 
+        domains = []
+
+        # The list view shows the users and models of every group, load
+        # them for all groups at once instead of once per group.
+        query = session.query(Group).options(
+            selectinload(Group.users), selectinload(Group.allowed_models)
+        )
+
         if realm == "*":
-            groups = session.query(Group).all()
+            groups = query.all()
+            default_group["nr_users"] = session.query(func.count(User.id)).scalar()
         elif admin_domains:
-            domains = [
-                domain.strip() for domain in admin_domains.split(",") if domain.strip()
-            ]
+            domains = user_admin_domains_split(admin_domains)
 
-            groups = session.query(Group).filter(Group.realm.in_(domains)).all()
+            groups = query.filter(Group.realm.in_(domains)).all()
         else:
-            groups = (
-                session.query(Group)
-                .filter(
-                    or_(
-                        Group.users.any(User.user_id == user_id),
-                        Group.owner_user_id == user_id,
-                    )
+            groups = query.filter(
+                or_(
+                    Group.users.any(User.user_id == user_id),
+                    Group.owner_user_id == user_id,
                 )
-                .all()
-            )
+            ).all()
+
+        customer_names = customer_names_from_user_ids(
+            list({group.owner_user_id for group in groups})
+        )
 
         for group in groups:
             group_dict = group.as_dict()
             group_dict["nr_users"] = len(group_dict["users"])
-            group_dict["customer_name"] = customer_get_from_user_id(
-                group_dict["owner_user_id"]
-            ).get("name", "None")
+            group_dict["customer_name"] = customer_names[group.owner_user_id]
 
             groups_list.append(group_dict)
-            all_users.extend(group_dict["users"])
 
         if realm != "*":
+            # All users in the realms the requester administers.
+            nr_all_users = (
+                session.query(func.count(User.id))
+                .filter(User.realm.in_(domains))
+                .scalar()
+            )
+
             group_for_all_users = {
                 "id": 0,
                 "name": "All users",
@@ -231,7 +238,7 @@ def group_get_all(user_id: str, realm: str) -> list[dict]:
                 "owner_user_id": None,
                 "quota_seconds": 0,
                 "users": [],
-                "nr_users": len(all_users),
+                "nr_users": nr_all_users,
                 "customer_name": "",
             }
 
@@ -252,16 +259,17 @@ def group_get_quota_left(group_id: int) -> int:
     """
 
     with get_session() as session:
-        if not (group := session.query(Group).filter(Group.id == group_id).first()):
+        if not (group := session.get(Group, group_id)):
             return 0
 
-        quota_seconds = group.quota_seconds
-        used_seconds = 0
-
-        for user in group.users:
-            used_seconds += user.transcribed_seconds if user.transcribed_seconds else 0
+        used_seconds = (
+            session.query(func.coalesce(func.sum(User.transcribed_seconds), 0))
+            .join(GroupUserLink, GroupUserLink.user_id == User.id)
+            .filter(GroupUserLink.group_id == group.id)
+            .scalar()
+        )
 
-        quota_left = quota_seconds - used_seconds
+        quota_left = group.quota_seconds - used_seconds
 
         return max(quota_left, 0)
 
@@ -277,7 +285,7 @@ def group_delete(group_id: int) -> bool:
         bool: True if the group was deleted, False otherwise.
     """
     with get_session() as session:
-        if not (group := session.query(Group).filter(Group.id == group_id).first()):
+        if not (group := session.get(Group, group_id)):
             return False
 
         session.delete(group)
@@ -332,12 +340,7 @@ def group_update(
     """
 
     with get_session() as session:
-        if not (
-            group := session.query(Group)
-            .filter(Group.id == group_id)
-            .with_for_update()
-            .first()
-        ):
+        if not (group := session.get(Group, group_id, with_for_update=True)):
             return {}
 
         if name is not None:
@@ -447,6 +450,81 @@ def group_remove_user(group_id: int, user_id: int) -> bool:
         return True
 
 
+def group_add_users_bulk(
+    group_id: int, usernames: list[str], role: str = "member"
+) -> Optional[dict]:
+    """
+    Add several users to a group in one transaction.
+    Users already in the group and unknown usernames are skipped.
+
+    Parameters:
+        group_id (int): The ID of the group.
+        usernames (list[str]): The usernames of the users to add.
+        role (str): The role of the users in the group.
+
+    Returns:
+        Optional[dict]: The group ID and the IDs of the added users, or None if
+                        the group was not found.
+    """
+    with get_session() as session:
+        if not session.get(Group, group_id):
+            return None
+
+        user_ids = {
+            row.id
+            for row in session.query(User.id).filter(User.username.in_(usernames))
+        }
+        existing = {
+            row.user_id
+            for row in session.query(GroupUserLink.user_id).filter(
+                GroupUserLink.group_id == group_id,
+                GroupUserLink.user_id.in_(user_ids),
+            )
+        }
+        added = sorted(user_ids - existing)
+
+        session.add_all(
+            GroupUserLink(group_id=group_id, user_id=user_id, role=role)
+            for user_id in added
+        )
+
+        log.info(f"Users {added} added to group {group_id} with role {role}.")
+
+        return {"group_id": group_id, "user_ids": added, "role": role}
+
+
+def group_remove_users_bulk(group_id: int, usernames: list[str]) -> Optional[int]:
+    """
+    Remove several users from a group with a single DELETE.
+
+    Parameters:
+        group_id (int): The ID of the group.
+        usernames (list[str]): The usernames of the users to remove.
+
+    Returns:
+        Optional[int]: The number of users removed, or None if the group was not
+                       found.
+    """
+    with get_session() as session:
+        if not session.get(Group, group_id):
+            return None
+
+        removed = (
+            session.query(GroupUserLink)
+            .filter(
+                GroupUserLink.group_id == group_id,
+                GroupUserLink.user_id.in_(
+                    select(User.id).where(User.username.in_(usernames))
+                ),
+            )
+            .delete(synchronize_session=False)
+        )
+
+        log.info(f"{removed} users removed from group {group_id}.")
+
+        return removed
+
+
 def group_add_model(group_id: int, model_id: int) -> dict:
     """
     Link a model to a group.
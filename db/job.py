@@ -206,7 +206,7 @@ def job_update(
     speakers: Optional[int] = None,
     error: Optional[str] = None,
     output_format: Optional[str] = None,
-    transcribed_seconds: Optional[int] = 0,
+    transcribed_seconds: Optional[float] = 0,
 ) -> Optional[Job]:
     """
     Update a job by UUID.
@@ -220,7 +220,8 @@ def job_update(
         speakers (int): The number of speakers in the job.
         error (str): An error message associated with the job.
         output_format (OutputFormatEnum): The desired output format for the job.
-        transcribed_seconds (int): The number of transcribed seconds.
+        transcribed_seconds (float): The number of transcribed seconds, rounded to
+            whole seconds.
 
     Returns:
         dict: The updated job as a dictionary if found, otherwise None.
@@ -247,13 +248,89 @@ def job_update(
         if output_format:
             job.output_format = output_format
         if transcribed_seconds:
-            job.transcribed_seconds = transcribed_seconds
+            job.transcribed_seconds = round(float(transcribed_seconds))
 
         log.info(f"Job {job.uuid} updated for user {user_id}.")
 
         return job.as_dict()
 
 
+def job_remove_files(user_id: str, uuid: str) -> None:
+    """
+    Remove the stored files of a job, encrypted or not.
+
+    Parameters:
+        user_id (str): The user ID owning the job.
+        uuid (str): The UUID of the job.
+
+    Returns:
+        None
+    """
+
+    user_dir = Path(settings.API_FILE_STORAGE_DIR) / user_id
+
+    for filename in (uuid, f"{uuid}.mp4", f"{uuid}.enc", f"{uuid}.mp4.enc"):
+        file_path = user_dir / filename
+
+        if file_path.exists():
+            file_path.unlink()
+
+
+def job_remove_all(user_id: str, job_uuids: list[str]) -> int:
+    """
+    Delete the given jobs of a user.
+    Does the same as job_remove for every job, but with one bulk update
+    and one bulk delete instead of a transaction per job.
+
+    Parameters:
+        user_id (str): The user ID owning the jobs.
+        job_uuids (list[str]): The UUIDs of the jobs to remove.
+
+    Returns:
+        int: The number of jobs removed.
+    """
+
+    if not job_uuids:
+        return 0
+
+    with get_session() as session:
+        # Anonymize job data instead of deleting the records.
+        # We keep the records for auditing and billing purposes.
+        jobs_removed = (
+            session.query(Job)
+            .filter(Job.user_id == user_id, Job.uuid.in_(job_uuids))
+            .update(
+                {
+                    Job.job_type: "transcription",
+                    Job.language: "",
+                    Job.model_type: "",
+                    Job.filename: "",
+                    Job.error: "",
+                    Job.speakers: 0,
+                    Job.status: JobStatusEnum.DELETED,
+                    Job.output_format: OutputFormatEnum.NONE,
+                },
+                synchronize_session=False,
+            )
+        )
+
+        results_removed = (
+            session.query(JobResult)
+            .filter(JobResult.job_id.in_(job_uuids))
+            .delete(synchronize_session=False)
+        )
+
+    log.info(
+        f"{jobs_removed} jobs and {results_removed} job results removed for user {user_id}."
+    )
+
+    # Remove the files once the database changes are committed.
+    for job_uuid in job_uuids:
+        job_remove_files(user_id, job_uuid)
+
+    return jobs_removed
+
+
 def job_remove(uuid: str) -> bool:
     """
     Delete a job by UUID.
@@ -271,28 +348,7 @@ def job_remove(uuid: str) -> bool:
         ):
             return False
 
-        file_path = Path(settings.API_FILE_STORAGE_DIR) / job.user_id / job.uuid
-        file_path_mp4 = (
-            Path(settings.API_FILE_STORAGE_DIR) / job.user_id / f"{job.uuid}.mp4"
-        )
-        file_path_mp4_enc = (
-            Path(settings.API_FILE_STORAGE_DIR) / job.user_id / f"{job.uuid}.mp4.enc"
-        )
-        file_path_enc = (
-            Path(settings.API_FILE_STORAGE_DIR) / job.user_id / f"{job.uuid}.enc"
-        )
-
-        if file_path.exists():
-            file_path.unlink()
-
-        if file_path_mp4.exists():
-            file_path_mp4.unlink()
-
-        if file_path_enc.exists():
-            file_path_enc.unlink()
-
-        if file_path_mp4_enc.exists():
-            file_path_mp4_enc.unlink()
+        job_remove_files(job.user_id, job.uuid)
 
         # Anonymize job data instead of deleting the record.
         # We keep the record for auditing and billing purposes.
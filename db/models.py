@@ -4,7 +4,8 @@ from typing import List, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel
-from sqlalchemy.types import Enum as SQLAlchemyEnum
+from sqlalchemy import Index, text
+from sqlalchemy.types import BigInteger, Enum as SQLAlchemyEnum
 from sqlmodel import Field, Relationship, SQLModel
 
 #
@@ -203,6 +204,16 @@ class Job(SQLModel, table=True):
     """
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index(
+            "ix_jobs_user_id_created_at_status", "user_id", "created_at", "status"
+        ),
+        Index(
+            "ix_jobs_queued_status",
+            "status",
+            postgresql_where=text("status IN ('UPLOADED', 'IN_PROGRESS')"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True, description="Primary key")
     uuid: str = Field(
@@ -337,6 +348,7 @@ class User(SQLModel, table=True):
     user_id: str = Field(
         default=None,
         index=True,
+        unique=True,
         description="User ID",
     )
     username: str = Field(
@@ -362,9 +374,23 @@ class User(SQLModel, table=True):
         description="Indicates if the user is a BOFH",
     )
     transcribed_seconds: int = Field(
-        default=None,
+        default=0,
+        sa_type=BigInteger,
         description="Transcribed seconds",
     )
+    month_key: Optional[int] = Field(
+        default=None,
+        description="Month (YYYYMM) the monthly counters below refer to",
+    )
+    month_seconds: int = Field(
+        default=0,
+        sa_type=BigInteger,
+        description="Transcribed seconds during the month in month_key",
+    )
+    month_files: int = Field(
+        default=0,
+        description="Transcribed files during the month in month_key",
+    )
     last_login: datetime = Field(
         default_factory=datetime.utcnow,
         description="Last login timestamp",
@@ -431,6 +457,20 @@ class Users(BaseModel):
     users: List[User]
 
 
+class UserAdminDomain(SQLModel, table=True):
+    """
+    Link table between users and the realms/domains they administer.
+    Kept in sync with User.admin_domains.
+    """
+
+    __tablename__ = "user_admin_domain"
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    domain: str = Field(
+        primary_key=True, index=True, description="Realm/domain administered"
+    )
+
+
 # Block diagram of the connection between users, groups, quota, models etc
 #
 # User <--> GroupUserLink <--> Group <--> GroupModelLink <--> Model
@@ -22,7 +22,13 @@ def get_sessionmaker() -> sessionmaker:
         sessionmaker: A SQLAlchemy sessionmaker instance.
     """
 
-    engine = create_engine(settings.API_DATABASE_URL)
+    # Sized for the request threadpool, every blocking request holds a
+    # connection while it runs.
+    engine = create_engine(
+        settings.API_DATABASE_URL,
+        pool_size=settings.API_DATABASE_POOL_SIZE,
+        max_overflow=settings.API_DATABASE_MAX_OVERFLOW,
+    )
 
     connection = engine.connect()
     if connection.dialect.has_schema(connection, "transcribe"):
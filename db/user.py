@@ -1,14 +1,28 @@
 import calendar
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from auth.client import dn_in_list
 from utils.log import get_logger
 
-from db.job import job_get_all, job_remove
-from db.models import Customer, Group, GroupUserLink, Job, User
+from db.customer import customer_get_partner_names
+from db.job import job_remove_all
+from db.models import (
+    Group,
+    GroupUserLink,
+    Job,
+    JobStatusEnum,
+    JobType,
+    User,
+    UserAdminDomain,
+)
 from db.session import get_session
+from sqlalchemy import Date, and_, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased, selectinload
+from utils.cache import Cache
 from utils.crypto import (
     generate_rsa_keypair,
     serialize_private_key_to_pem,
@@ -20,6 +34,56 @@ from utils.settings import get_settings
 settings = get_settings()
 log = get_logger()
 
+# Users are looked up on every encryption and decryption operation, keep
+# their keys around for a short while. The cache is per process and entries
+# are only dropped in the process that updates the user, other workers can
+# serve them until they expire. The fields used for access control are
+# therefore never cached, only the ones below.
+user_cache = Cache(maxsize=settings.API_CACHE_SIZE, ttl=settings.API_CACHE_TTL)
+user_cache_fields = ("user_id", "username", "public_key", "private_key")
+
+# Admins per realm, looked up whenever a new user is created. Cleared
+# whenever admin settings of any user change.
+admin_cache = Cache(maxsize=256, ttl=settings.API_CACHE_TTL)
+
+# Statistics are expensive to compute and requested repeatedly by the admin
+# views, e.g. once per group when listing groups. Short lived, entries are
+# not invalidated on updates.
+statistics_cache = Cache(maxsize=256, ttl=settings.API_STATISTICS_CACHE_TTL)
+
+
+def user_cache_invalidate(user_id: str) -> None:
+    """
+    Remove a user from the user cache.
+
+    Parameters:
+        user_id (str): The user ID.
+
+    Returns:
+        None
+    """
+
+    user_cache.delete(user_id)
+
+
+def user_admin_domains_split(admin_domains: Optional[str]) -> list[str]:
+    """
+    Split a comma separated admin_domains value into its domains.
+    Whitespace around the domains and empty entries are dropped, so
+    "a.se, b.se," gives ["a.se", "b.se"].
+
+    Parameters:
+        admin_domains (Optional[str]): The admin_domains value of a user.
+
+    Returns:
+        list[str]: The domains, empty if admin_domains is empty or None.
+    """
+
+    if not admin_domains:
+        return []
+
+    return [domain.strip() for domain in admin_domains.split(",") if domain.strip()]
+
 
 def user_create(
     username: str,
@@ -49,48 +113,92 @@ def user_create(
             .first()
         )
 
-        if user:
+        created = False
+
+        if not user:
+            user = User(
+                username=username,
+                realm=realm,
+                user_id=user_id,
+                transcribed_seconds=0,
+                last_login=datetime.utcnow(),
+                email=email,
+            )
+
+            # Another worker might create the same user between the query
+            # above and this insert. The unique user_id index catches that
+            # and the user created by the other worker is used instead.
+            try:
+                with session.begin_nested():
+                    session.add(user)
+
+                created = True
+            except IntegrityError:
+                user = session.query(User).filter(User.user_id == user_id).one()
+
+        if not created:
             if email != "" and user.email == "":
                 user.email = email
+                admin_cache.clear()
 
             user.last_login = datetime.utcnow()
 
             return user.as_dict()
 
-        user = User(
-            username=username,
-            realm=realm,
-            user_id=user_id,
-            transcribed_seconds="0",
-            last_login=datetime.utcnow(),
-            email=email,
-        )
-
         log.info(f"User {username} created with realm {realm}.")
 
-        session.add(user)
+        user_dict = user.dict()
 
-        # Figure out which users we should send a notification
-        # email to about the new user creation.
-        admins = users_admin_domains_from_realm(realm)
+    # Notify the admins once the new user is committed, outside of the
+    # transaction.
+    user_notify_admins_new_user(realm, username, user_id)
 
-        for admin in admins:
-            if not admin["admin"]:
-                continue
+    return user_dict
 
-            if admin_email := user_get_notifications(admin["user_id"], "user"):
-                if notifications.notification_sent_record_exists(
-                    admin["user_id"], user.user_id, "user_creation"
-                ):
-                    continue
 
-                notifications.send_new_user_created(admin_email, username)
-                notifications.notification_sent_record_add(
-                    admin["user_id"], user.user_id, "user_creation"
-                )
-                log.info(f"Sent new user creation notification to admin {admin_email}")
+def user_notify_admins_new_user(realm: str, username: str, user_id: str) -> None:
+    """
+    Send a notification email about a new user to the admins of a realm
+    which have user notifications enabled.
+
+    Parameters:
+        realm (str): The realm/domain of the new user.
+        username (str): The username of the new user.
+        user_id (str): The user ID of the new user.
+
+    Returns:
+        None
+    """
+
+    admins = []
+
+    for admin in users_admin_domains_from_realm(realm):
+        if not admin["admin"] or not admin["email"]:
+            continue
+
+        admin_notifications = admin["notifications"] or ""
+
+        if "user" not in admin_notifications.split(","):
+            continue
+
+        admins.append(admin)
+
+    already_notified = notifications.notification_sent_records_for(
+        [admin["user_id"] for admin in admins], user_id, "user_creation"
+    )
+    admins = [admin for admin in admins if admin["user_id"] not in already_notified]
+
+    if not admins:
+        return
 
-        return user.dict()
+    to_emails = [admin["email"] for admin in admins]
+
+    notifications.send_new_user_created(to_emails, username)
+    notifications.notification_sent_records_add(
+        [admin["user_id"] for admin in admins], user_id, "user_creation"
+    )
+
+    log.info(f"Sent new user creation notification to admins {', '.join(to_emails)}")
 
 
 def user_exists(username: str) -> bool:
@@ -104,9 +212,9 @@ def user_exists(username: str) -> bool:
         bool: True if the user exists, False otherwise.
     """
     with get_session() as session:
-        user = session.query(User).filter(User.username == username).first()
-
-        return user is not None
+        return session.query(
+            session.query(User.id).filter(User.username == username).exists()
+        ).scalar()
 
 
 def user_get_from_job(job_id: str) -> Optional[User]:
@@ -120,15 +228,18 @@ def user_get_from_job(job_id: str) -> Optional[User]:
         Optional[User]: The user associated with the job, or None if not found.
     """
     with get_session() as session:
-        if not (job := session.query(Job).filter(Job.uuid == job_id).first()):
+        if not (
+            row := session.query(Job.user_id, User.user_id.label("known_user_id"))
+            .outerjoin(User, User.user_id == Job.user_id)
+            .filter(Job.uuid == job_id)
+            .first()
+        ):
             return None
 
-        user = session.query(User).filter(User.user_id == job.user_id).first()
-
-        if user is None and dn_in_list(job.user_id):
-            return job.user_id
+        if row.known_user_id is None and dn_in_list(row.user_id):
+            return row.user_id
 
-        return user.as_dict()["user_id"] if user else None
+        return row.known_user_id
 
 
 def user_get_username_from_job(job_id: str) -> Optional[User]:
@@ -142,12 +253,12 @@ def user_get_username_from_job(job_id: str) -> Optional[User]:
         Optional[User]: The user associated with the job, or None if not found.
     """
     with get_session() as session:
-        if not (job := session.query(Job).filter(Job.uuid == job_id).first()):
-            return None
-
-        user = session.query(User).filter(User.user_id == job.user_id).first()
-
-        return user.as_dict()["username"] if user else None
+        return (
+            session.query(User.username)
+            .join(Job, Job.user_id == User.user_id)
+            .filter(Job.uuid == job_id)
+            .scalar()
+        )
 
 
 def user_get(
@@ -155,6 +266,8 @@ def user_get(
 ) -> Optional[User]:
     """
     Get a user by user_id.
+    Always read from the database, the user's keys are cached for
+    user_get_private_key() and user_get_public_key().
 
     Parameters:
         user_id (Optional[str]): The user ID.
@@ -173,12 +286,20 @@ def user_get(
         else:
             user = session.query(User).filter(User.username == username).first()
 
-        return user.as_dict()
+        user_dict = user.as_dict()
+
+    user_cache.set(
+        user_dict["user_id"], {field: user_dict[field] for field in user_cache_fields}
+    )
+
+    return user_dict
 
 
 def user_get_private_key(user_id: str) -> Optional[str]:
     """
     Get a users private key.
+    Uses the user cache if the user is cached, otherwise only the key
+    column is fetched.
 
     Parameters:
         user_id (str): The user ID.
@@ -188,12 +309,22 @@ def user_get_private_key(user_id: str) -> Optional[str]:
     """
     log.info(f"Fetching private key for user {user_id}")
 
-    return user_get(user_id)["private_key"].encode("utf-8")
+    if user_dict := user_cache.get(user_id):
+        key = user_dict["private_key"]
+    else:
+        with get_session() as session:
+            key = (
+                session.query(User.private_key).filter(User.user_id == user_id).scalar()
+            )
+
+    return key.encode("utf-8") if key else None
 
 
 def user_get_public_key(user_id: str) -> Optional[str]:
     """
     Get a users public key.
+    Uses the user cache if the user is cached, otherwise only the key
+    column is fetched.
 
     Parameters:
         user_id (str): The user ID.
@@ -202,7 +333,15 @@ def user_get_public_key(user_id: str) -> Optional[str]:
         Optional[str]: The user's public key, or None if not found.
     """
 
-    return user_get(user_id)["public_key"].encode("utf-8")
+    if user_dict := user_cache.get(user_id):
+        key = user_dict["public_key"]
+    else:
+        with get_session() as session:
+            key = (
+                session.query(User.public_key).filter(User.user_id == user_id).scalar()
+            )
+
+    return key.encode("utf-8") if key else None
 
 
 def user_get_all(realm) -> list:
@@ -216,52 +355,32 @@ def user_get_all(realm) -> list:
         list: A list of users in the specified realm.
     """
     with get_session() as session:
-        if realm == "*":
-            q = (
-                session.query(User, Group)
-                .outerjoin(GroupUserLink, GroupUserLink.user_id == User.id)
-                .outerjoin(Group, Group.id == GroupUserLink.group_id)
-            )
-            rows = q.all()
+        q = session.query(User).options(selectinload(User.groups))
 
-        else:
-            q = (
-                session.query(User, Group)
-                .outerjoin(GroupUserLink, GroupUserLink.user_id == User.id)
-                .outerjoin(Group, Group.id == GroupUserLink.group_id)
-                .filter(User.realm == realm)
-            )
-            rows = q.all()
+        if realm != "*":
+            q = q.filter(User.realm == realm)
 
-        group_map = {}
+        # Customer names for REACH users (numeric usernames)
+        customer_names = customer_get_partner_names()
 
-        for row in rows:
-            user_dict = row[0].as_dict()
-            group_dict = row[1].as_dict() if row[1] else []
+        users = []
 
-            if user_dict["username"] == "api_user":
+        # Stream the users in batches instead of materializing the whole
+        # result set, large realms can have thousands of users.
+        for user in q.yield_per(1000):
+            if user.username == "api_user":
                 continue
-            elif user_dict["username"].isdigit():
-                customer = (
-                    session.query(Customer)
-                    .filter(Customer.partner_id == user_dict["username"])
-                    .first()
-                )
 
-                if customer:
-                    user_dict["username"] = "(REACH) " + customer.name
+            user_dict = user.as_dict()
 
-            if user_dict["id"] in group_map:
-                group_map[user_dict["id"]]["groups"] += ", " + group_dict["name"]
-            else:
-                group_map[user_dict["id"]] = user_dict
-                group_map[user_dict["id"]]["groups"] = (
-                    group_dict["name"] if group_dict else ""
-                )
+            if user_dict["username"].isdigit():
+                if name := customer_names.get(user_dict["username"]):
+                    user_dict["username"] = "(REACH) " + name
 
-        result = list(group_map.values())
+            user_dict["groups"] = ", ".join(group.name for group in user.groups)
+            users.append(user_dict)
 
-        return result
+        return users
 
 
 def user_get_quota_left(user_id: str) -> bool:
@@ -276,37 +395,62 @@ def user_get_quota_left(user_id: str) -> bool:
     """
 
     with get_session() as session:
+        # The users groups together with this months usage of all their
+        # members, summed up by the database in a single query.
+        member = aliased(User)
+        member_link = aliased(GroupUserLink)
+
         groups = (
-            session.query(Group).filter(Group.users.any(User.user_id == user_id)).all()
+            session.query(
+                func.coalesce(Group.quota_seconds, 0).label("quota_seconds"),
+                func.coalesce(func.sum(member.month_seconds), 0).label("used_seconds"),
+            )
+            .join(GroupUserLink, GroupUserLink.group_id == Group.id)
+            .join(User, User.id == GroupUserLink.user_id)
+            .filter(User.user_id == user_id)
+            .outerjoin(member_link, member_link.group_id == Group.id)
+            .outerjoin(
+                member,
+                and_(
+                    member.id == member_link.user_id,
+                    member.month_key == user_month_key(),
+                ),
+            )
+            .group_by(Group.id, Group.quota_seconds)
+            .all()
         )
 
-        if not groups:
+    if not groups:
+        return True
+
+    for group in groups:
+        # A quota of 0 or NULL means unlimited.
+        if group.quota_seconds == 0 or group.used_seconds < group.quota_seconds:
             return True
 
-        for group in groups:
-            if group.quota_seconds == 0:
-                return True
+    return False
 
-            group_statistics_res = group_statistics(group.id, user_id, group.realm)
 
-            if not group_statistics_res:
-                return True
+def user_month_key(date: Optional[datetime] = None) -> int:
+    """
+    Get the key used for the monthly transcription counters.
 
-            if "total_transcribed_minutes" not in group_statistics_res:
-                return True
+    Parameters:
+        date (Optional[datetime]): The date to get the key for, defaults to now.
 
-            if (
-                group_statistics_res["total_transcribed_minutes"]
-                < group.quota_seconds / 60
-            ):
-                return True
+    Returns:
+        int: The month key on the form YYYYMM.
+    """
 
-    return False
+    date = date or datetime.utcnow()
+
+    return date.year * 100 + date.month
 
 
 def user_update(
     user_id: str,
-    transcribed_seconds: Optional[str] = "",
+    transcribed_seconds: Optional[float] = 0,
+    job_type: Optional[JobType] = None,
     active: Optional[bool] = None,
     admin: Optional[bool] = None,
     admin_domains: Optional[str] = None,
@@ -321,7 +465,9 @@ def user_update(
 
     Parameters:
         user_id (str): The user ID.
-        transcribed_seconds (Optional[str]): The number of transcribed seconds to add.
+        transcribed_seconds (Optional[float]): The number of transcribed seconds to add.
+        job_type (Optional[JobType]): The type of the completed job the seconds
+            belong to, only transcription jobs count towards the monthly counters.
         active (Optional[bool]): The active status to set.
         admin (Optional[bool]): The admin status to set.
         admin_domains (Optional[str]): The admin domains to set.
@@ -333,11 +479,25 @@ def user_update(
         dict: The updated user as a dictionary.
     """
 
+    job_uuids = []
+
+    if encryption_settings and encryption_password != "":
+        # Generating the key pair is slow, do it before locking the user.
+        private_key, public_key = generate_rsa_keypair(
+            key_size=settings.CRYPTO_KEY_SIZE
+        )
+
+        # Serialize keys to PEM format
+        serialized_private_key = serialize_private_key_to_pem(
+            private_key, encryption_password.encode("utf-8")
+        )
+        serialized_public_key = serialize_public_key_to_pem(public_key)
+
     with get_session() as session:
         user = (
             session.query(User)
             .filter(User.user_id == user_id)
-            .with_for_update()
+            .with_for_update(key_share=True)
             .first()
         )
 
@@ -349,6 +509,19 @@ def user_update(
         if transcribed_seconds:
             user.transcribed_seconds += float(transcribed_seconds)
 
+        # Keep the monthly counters up to date so that quota checks don't
+        # have to go through all jobs of the month. The seconds are rounded
+        # the same way as in job_update(), so that the counters match the
+        # sum over the jobs.
+        if job_type == JobType.TRANSCRIPTION:
+            if user.month_key != (month_key := user_month_key()):
+                user.month_key = month_key
+                user.month_seconds = 0
+                user.month_files = 0
+
+            user.month_seconds += round(float(transcribed_seconds or 0))
+            user.month_files += 1
+
         if active is not None:
             log.info(f"Setting user {user.user_id} active status to {active}")
             user.active = active
@@ -374,22 +547,21 @@ def user_update(
             log.info(f"Setting user {user.user_id} admin domains to {admin_domains}")
             user.admin_domains = admin_domains
 
+            # Keep the normalized admin domains in sync.
+            session.query(UserAdminDomain).filter(
+                UserAdminDomain.user_id == user.id
+            ).delete()
+
+            for domain in {
+                domain.lower() for domain in user_admin_domains_split(admin_domains)
+            }:
+                session.add(UserAdminDomain(user_id=user.id, domain=domain))
+
         if encryption_settings and encryption_password != "":
             log.info(f"Updating encryption settings for user {user.user_id}")
 
             user.encryption_settings = True
 
-            # Generate RSA key pair
-            private_key, public_key = generate_rsa_keypair(
-                key_size=settings.CRYPTO_KEY_SIZE
-            )
-
-            # Serialize keys to PEM format
-            serialized_private_key = serialize_private_key_to_pem(
-                private_key, encryption_password.encode("utf-8")
-            )
-            serialized_public_key = serialize_public_key_to_pem(public_key)
-
             # Store keys as UTF-8 strings
             user.private_key = serialized_private_key.decode("utf-8")
             user.public_key = serialized_public_key.decode("utf-8")
@@ -402,11 +574,13 @@ def user_update(
             user.private_key = None
             user.public_key = None
 
-            # Remove all files encrypted with the previous key
-            jobs = session.query(Job).filter(Job.user_id == user.user_id).all()
-
-            for job in jobs:
-                job_remove(job.uuid)
+            # Remove all jobs encrypted with the previous key once the
+            # user is no longer locked. Jobs uploaded after this commit may
+            # already use a new key and must be left alone.
+            job_uuids = [
+                job.uuid
+                for job in session.query(Job.uuid).filter(Job.user_id == user.user_id)
+            ]
 
         if email:
             log.info(f"Updating email for user {user.user_id} to {email}")
@@ -427,7 +601,20 @@ def user_update(
             + f"active={user.active}, admin={user.admin}",
         )
 
-        return user.as_dict() if user else {}
+        user_dict = user.as_dict()
+
+    if job_uuids:
+        job_remove_all(user_dict["user_id"], job_uuids)
+
+    # Drop the cached user once the changes are committed.
+    user_cache_invalidate(user_dict["user_id"])
+
+    if any(
+        value is not None for value in (admin, admin_domains, notifications_str, email)
+    ):
+        admin_cache.clear()
+
+    return user_dict
 
 
 def user_get_email(user_id: str) -> Optional[str]:
@@ -442,14 +629,15 @@ def user_get_email(user_id: str) -> Optional[str]:
     """
 
     with get_session() as session:
-        user = session.query(User).filter(User.user_id == user_id).first()
-
-        return user.email if user else None
+        return session.query(User.email).filter(User.user_id == user_id).scalar()
 
 
 def get_username_from_id(user_id: str) -> Optional[str]:
     """
     Get a username by user_id.
+    Served from the user cache when possible. That is safe across workers,
+    since a username is set when the user is created and never changed, and
+    users are never deleted.
 
     Parameters:
         user_id (str): The user ID.
@@ -458,10 +646,46 @@ def get_username_from_id(user_id: str) -> Optional[str]:
         Optional[str]: The username associated with the user_id, or None if not found.
     """
 
+    if user_dict := user_cache.get(user_id):
+        return user_dict["username"]
+
     with get_session() as session:
-        user = session.query(User).filter(User.user_id == user_id).first()
+        return session.query(User.username).filter(User.user_id == user_id).scalar()
+
+
+@lru_cache(maxsize=4)
+def users_statistics_days(
+    year: int, month: int
+) -> tuple[date, date, tuple[str, ...], tuple[str, ...]]:
+    """
+    Get the days covered by the user statistics for a month, the month
+    itself and the month before it. Only changes once a month, so the
+    result is cached.
+
+    Parameters:
+        year (int): The year.
+        month (int): The month.
+
+    Returns:
+        tuple: The first day of the previous month, the first day of the
+        month, and the ISO dates of all days in the previous month and in
+        the month.
+    """
 
-    return user.username if user else None
+    first_day_this_month = date(year, month, 1)
+    last_day_prev_month = first_day_this_month - timedelta(days=1)
+    first_day_prev_month = last_day_prev_month.replace(day=1)
+
+    days_prev_month = tuple(
+        (first_day_prev_month + timedelta(days=i)).isoformat()
+        for i in range(last_day_prev_month.day)
+    )
+    days_this_month = tuple(
+        (first_day_this_month + timedelta(days=i)).isoformat()
+        for i in range(calendar.monthrange(year, month)[1])
+    )
+
+    return first_day_prev_month, first_day_this_month, days_prev_month, days_this_month
 
 
 def users_statistics(
@@ -469,39 +693,44 @@ def users_statistics(
     realm: Optional[str] = "",
     days: Optional[int] = 30,
     user_id: Optional[str] = "",
+    include_users: Optional[bool] = True,
 ) -> dict:
     """
     Get user statistics for the last 'days' days.
     Shows customer names instead of usernames when available.
+    Results are cached for API_STATISTICS_CACHE_TTL seconds.
 
     Parameters:
         group_id (Optional[str]): The group ID to filter users by.
         realm (Optional[str]): The realm/domain to filter users by.
         days (Optional[int]): The number of days to look back for statistics.
         user_id (Optional[str]): The user ID of the requesting user.
+        include_users (Optional[bool]): Whether to include the users, the
+            per user and per day statistics and the job queue, or only the
+            totals.
 
     Returns:
         dict: A dictionary containing user statistics.
     """
 
+    key = (group_id, realm, days, user_id, include_users)
+
+    if stats := statistics_cache.get(key):
+        return stats
+
     with get_session() as session:
-        user = session.query(User).filter(User.user_id == user_id).first()
-        user_domains = (
-            user.admin_domains.split(",") if user and user.admin_domains else []
+        admin_domains = (
+            session.query(User.admin_domains).filter(User.user_id == user_id).scalar()
         )
+        user_domains = user_admin_domains_split(admin_domains)
 
         if group_id == "0":
-            if realm == "*":
-                users = session.query(User).all()
-            else:
-                users = session.query(User).filter(User.realm.in_(user_domains)).all()
-        else:
-            if realm == "*":
-                group = session.query(Group).filter(Group.id == group_id).first()
-            else:
-                group = session.query(Group).filter(Group.id == group_id).first()
+            users = session.query(User)
 
-            if not group:
+            if realm != "*":
+                users = users.filter(User.realm.in_(user_domains))
+        else:
+            if not (group := session.get(Group, group_id)):
                 return {
                     "total_users": 0,
                     "active_users": [],
@@ -515,7 +744,14 @@ def users_statistics(
                     "job_queue": {},
                 }
 
-            users = group.users
+            users = (
+                session.query(User)
+                .join(GroupUserLink, GroupUserLink.user_id == User.id)
+                .filter(GroupUserLink.group_id == group.id)
+            )
+
+        total_users = 0
+        active_users = []
 
         total_transcribed_minutes = 0
         total_transcribed_minutes_last_month = 0
@@ -526,136 +762,123 @@ def users_statistics(
         transcribed_minutes_per_user = {}
         transcribed_minutes_per_user_last_month = {}
 
-        transcribed_minutes_per_day = {}
-        transcribed_minutes_per_day_last_month = {}
-
         job_queue = []
 
         today = datetime.utcnow().date()
-        last_day = calendar.monthrange(today.year, today.month)[1]
-        last_date_string = f"{today.year}-{today.month:02d}-{last_day}"
-        last_date = datetime.fromisoformat(last_date_string).date()
-        start_date = today.replace(day=1)
-
-        date_range = [
-            (start_date + timedelta(days=i)).isoformat()
-            for i in range((last_date - start_date).days + 1)
-        ]
 
-        first_day_this_month = today.replace(day=1)
-        last_day_prev_month = first_day_this_month - timedelta(days=1)
-        first_day_prev_month = last_day_prev_month.replace(day=1)
+        (
+            first_day_prev_month,
+            first_day_this_month,
+            days_prev_month,
+            days_this_month,
+        ) = users_statistics_days(today.year, today.month)
 
-        num_days_prev_month = last_day_prev_month.day
+        # Transcribed seconds per day for the previous and the current month,
+        # indexed by the number of days since first_day_prev_month.
+        seconds_per_day = [0] * (len(days_prev_month) + len(days_this_month))
 
-        date_range_prev_month = [
-            (first_day_prev_month + timedelta(days=i)).isoformat()
-            for i in range(num_days_prev_month)
-        ]
+        # Customer names for REACH users (numeric usernames)
+        customer_names = customer_get_partner_names() if include_users else {}
 
-        transcribed_minutes_per_day = {d: 0 for d in date_range}
-        transcribed_minutes_per_day_last_month = {d: 0 for d in date_range_prev_month}
+        display_names = {}
 
-        for user in users:
-            jobs = job_get_all(user.user_id, cleaned=True)["jobs"]
+        if include_users:
+            for user in users.yield_per(1000):
+                total_users += 1
+                active_users.append(user.as_dict())
 
-            if not jobs:
-                continue
-
-            if user.username.isdigit():
-                customer = (
-                    session.query(Customer)
-                    .filter(Customer.partner_id == user.username)
-                    .first()
-                )
-                if customer:
-                    display_name = "(REACH) " + customer.name
+                if user.username.isdigit() and user.username in customer_names:
+                    display_name = "(REACH) " + customer_names[user.username]
                 else:
                     display_name = user.username
+
+                display_names[user.user_id] = display_name
+        else:
+            total_users = users.count()
+
+        # Let the database sum up the transcribed jobs per user and day,
+        # only the grouped rows are returned.
+        job_day = func.date(Job.created_at, type_=Date)
+        transcribed_per_day = (
+            session.query(
+                Job.user_id,
+                job_day,
+                func.count(Job.id),
+                func.coalesce(func.sum(Job.transcribed_seconds), 0),
+            )
+            .filter(Job.user_id.in_(users.with_entities(User.user_id)))
+            .filter(Job.job_type == JobType.TRANSCRIPTION)
+            .filter(Job.status.in_([JobStatusEnum.COMPLETED, JobStatusEnum.DELETED]))
+            .filter(Job.created_at >= first_day_prev_month)
+            .group_by(Job.user_id, job_day)
+        )
+
+        for job_user_id, job_date, files, seconds in transcribed_per_day:
+            seconds_per_day[(job_date - first_day_prev_month).days] += seconds
+            minutes = seconds / 60
+
+            if job_date >= first_day_this_month:
+                transcribed_files += files
+                total_transcribed_minutes += minutes
+                minutes_per_user = transcribed_minutes_per_user
             else:
-                display_name = user.username
-
-            for job in jobs:
-                job_date = datetime.strptime(
-                    job["created_at"], "%Y-%m-%d %H:%M:%S.%f"
-                ).date()
-
-                job_date_str = job_date.isoformat()
-
-                if job_date >= first_day_this_month:
-                    if job["status"] == "completed" or job["status"] == "deleted":
-                        transcribed_files += 1
-                        total_transcribed_minutes += job["transcribed_seconds"] / 60
-
-                        transcribed_minutes_per_day[job_date_str] += (
-                            job["transcribed_seconds"] / 60
-                        )
-
-                        if display_name not in transcribed_minutes_per_user:
-                            transcribed_minutes_per_user[display_name] = 0
-
-                        transcribed_minutes_per_user[display_name] += (
-                            job["transcribed_seconds"] / 60
-                        )
-
-                    if job["status"] == "uploaded" or job["status"] == "in_progress":
-                        if job["status"] == "in_progress":
-                            status = "transcribing"
-                        else:
-                            status = job["status"]
-
-                        job_data = {
-                            "status": status,
-                            "created_at": job["created_at"],
-                            "updated_at": job["updated_at"],
-                            "job_id": job["uuid"],
-                            "username": display_name,  # Use display name
-                        }
-
-                        job_queue.append(job_data)
-                elif first_day_prev_month <= job_date <= last_day_prev_month:
-                    if job["status"] == "completed" or job["status"] == "deleted":
-                        transcribed_files_last_month += 1
-
-                        total_transcribed_minutes_last_month += (
-                            job["transcribed_seconds"] / 60
-                        )
-
-                        transcribed_minutes_per_day_last_month[job_date_str] += (
-                            job["transcribed_seconds"] / 60
-                        )
-
-                        if display_name not in transcribed_minutes_per_user_last_month:
-                            transcribed_minutes_per_user_last_month[display_name] = 0
-
-                        transcribed_minutes_per_user_last_month[display_name] += (
-                            job["transcribed_seconds"] / 60
-                        )
-
-                    if job["status"] == "uploaded" or job["status"] == "in_progress":
-                        if job["status"] == "in_progress":
-                            status = "transcribing"
-                        else:
-                            status = job["status"]
-
-                        job_data = {
-                            "status": status,
-                            "created_at": job["created_at"],
-                            "updated_at": job["updated_at"],
-                            "job_id": job["uuid"],
-                            "username": display_name,  # Use display name
-                        }
-
-                        job_queue.append(job_data)
+                transcribed_files_last_month += files
+                total_transcribed_minutes_last_month += minutes
+                minutes_per_user = transcribed_minutes_per_user_last_month
+
+            if include_users:
+                display_name = display_names[job_user_id]
+                minutes_per_user[display_name] = (
+                    minutes_per_user.get(display_name, 0) + minutes
+                )
+
+        # Queued jobs are fetched with a single query instead of being
+        # picked out of every user's job list. Only the needed columns are
+        # selected and the rows are streamed in batches.
+        queued_jobs = (
+            select(Job.uuid, Job.status, Job.created_at, Job.updated_at, Job.user_id)
+            .where(Job.user_id.in_(users.with_entities(User.user_id)))
+            .where(Job.job_type == JobType.TRANSCRIPTION)
+            .where(Job.status.in_([JobStatusEnum.UPLOADED, JobStatusEnum.IN_PROGRESS]))
+            .where(Job.created_at >= first_day_prev_month)
+            .order_by(Job.created_at)
+        )
+
+        if include_users:
+            for job in session.execute(queued_jobs).yield_per(1000):
+                if job.status == JobStatusEnum.IN_PROGRESS:
+                    status = "transcribing"
                 else:
-                    log.debug(
-                        f"Skipping job {job['uuid']} for user {user.username}"
-                        + f" with date {job_date_str}"
-                    )
-
-        return {
-            "total_users": len(users),
-            "active_users": [user.as_dict() for user in users],
+                    status = job.status
+
+                job_queue.append(
+                    {
+                        "status": status,
+                        "created_at": str(job.created_at),
+                        "updated_at": str(job.updated_at),
+                        "job_id": job.uuid,
+                        "username": display_names[job.user_id],
+                    }
+                )
+
+        transcribed_minutes_per_day = {}
+        transcribed_minutes_per_day_last_month = {}
+
+        if include_users:
+            minutes_per_day = [
+                seconds / 60 if seconds else 0 for seconds in seconds_per_day
+            ]
+
+            transcribed_minutes_per_day_last_month = dict(
+                zip(days_prev_month, minutes_per_day)
+            )
+            transcribed_minutes_per_day = dict(
+                zip(days_this_month, minutes_per_day[len(days_prev_month) :])
+            )
+
+        stats = {
+            "total_users": total_users,
+            "active_users": active_users,
             "transcribed_files": int(transcribed_files),
             "transcribed_files_last_month": int(transcribed_files_last_month),
             "total_transcribed_minutes": float(total_transcribed_minutes),
@@ -669,6 +892,10 @@ def users_statistics(
             "job_queue": job_queue,
         }
 
+    statistics_cache.set(key, stats)
+
+    return stats
+
 
 def group_statistics(group_id: str, user_id: str, realm: str) -> dict:
     """
@@ -683,7 +910,9 @@ def group_statistics(group_id: str, user_id: str, realm: str) -> dict:
         dict: A dictionary containing group statistics.
     """
 
-    stats = users_statistics(group_id=group_id, user_id=user_id, realm=realm)
+    stats = users_statistics(
+        group_id=group_id, user_id=user_id, realm=realm, include_users=False
+    )
 
     condensed_stats = {
         "total_users": stats["total_users"],
@@ -698,6 +927,87 @@ def group_statistics(group_id: str, user_id: str, realm: str) -> dict:
     return condensed_stats
 
 
+def group_statistics_bulk(group_ids: list, user_id: str, realm: str) -> dict:
+    """
+    Get group statistics for several groups at once.
+    Same statistics as group_statistics, but the member and job totals of
+    all groups are summed up by two grouped queries instead of one set of
+    queries per group.
+
+    Parameters:
+        group_ids (list): The group IDs.
+        user_id (str): The user ID of the requesting user.
+        realm (str): The realm/domain to filter users by.
+
+    Returns:
+        dict: Group statistics keyed by the group ID as a string.
+    """
+
+    group_ids = [str(group_id) for group_id in group_ids]
+    stats = {
+        group_id: {
+            "total_users": 0,
+            "transcribed_files": 0,
+            "transcribed_files_last_month": 0,
+            "total_transcribed_minutes": 0.0,
+            "total_transcribed_minutes_last_month": 0.0,
+        }
+        for group_id in group_ids
+        if group_id != "0"
+    }
+
+    # The default group holds all users in the realm, not group members.
+    if "0" in group_ids:
+        stats["0"] = group_statistics("0", user_id, realm)
+
+    if not (ids := [int(group_id) for group_id in stats if group_id != "0"]):
+        return stats
+
+    today = datetime.utcnow().date()
+    first_day_prev_month, first_day_this_month, _, _ = users_statistics_days(
+        today.year, today.month
+    )
+
+    with get_session() as session:
+        users_per_group = (
+            session.query(GroupUserLink.group_id, func.count(GroupUserLink.user_id))
+            .filter(GroupUserLink.group_id.in_(ids))
+            .group_by(GroupUserLink.group_id)
+        )
+
+        for group_id, total_users in users_per_group:
+            stats[str(group_id)]["total_users"] = total_users
+
+        this_month = Job.created_at >= first_day_this_month
+        jobs_per_group = (
+            session.query(
+                GroupUserLink.group_id,
+                this_month.label("this_month"),
+                func.count(Job.id),
+                func.coalesce(func.sum(Job.transcribed_seconds), 0),
+            )
+            .join(User, User.id == GroupUserLink.user_id)
+            .join(Job, Job.user_id == User.user_id)
+            .filter(GroupUserLink.group_id.in_(ids))
+            .filter(Job.job_type == JobType.TRANSCRIPTION)
+            .filter(Job.status.in_([JobStatusEnum.COMPLETED, JobStatusEnum.DELETED]))
+            .filter(Job.created_at >= first_day_prev_month)
+            .group_by(GroupUserLink.group_id, this_month)
+        )
+
+        for group_id, is_this_month, files, seconds in jobs_per_group:
+            group_stats = stats[str(group_id)]
+
+            if is_this_month:
+                group_stats["transcribed_files"] += files
+                group_stats["total_transcribed_minutes"] += seconds / 60
+            else:
+                group_stats["transcribed_files_last_month"] += files
+                group_stats["total_transcribed_minutes_last_month"] += seconds / 60
+
+    return stats
+
+
 def user_can_transcribe(user_id: str) -> int:
     """
     Check which group a user belongs to and check whether the user have
@@ -713,25 +1023,32 @@ def user_can_transcribe(user_id: str) -> int:
             >0 indicating the number of seconds left in the quota.
     """
 
+    # The users transcribed seconds and the quotas of all of its groups
+    # in a single round trip. A group quota of 0 or NULL means unlimited.
     with get_session() as session:
-        if not (user := session.query(User).filter(User.user_id == user_id).first()):
-            return 0
-
-        groups = (
-            session.query(Group).filter(Group.users.any(User.user_id == user_id)).all()
+        row = (
+            session.query(
+                User.transcribed_seconds,
+                func.count(Group.id).label("nr_groups"),
+                func.min(func.coalesce(Group.quota_seconds, 0)).label("min_quota"),
+                func.max(func.coalesce(Group.quota_seconds, 0)).label("max_quota"),
+            )
+            .outerjoin(GroupUserLink, GroupUserLink.user_id == User.id)
+            .outerjoin(Group, Group.id == GroupUserLink.group_id)
+            .filter(User.user_id == user_id)
+            .group_by(User.id, User.transcribed_seconds)
+            .first()
         )
 
-        if not groups:
-            return -1
+    if not row:
+        return 0
 
-        for group in groups:
-            if group.transcription_quota == 0:
-                return -1  # Unlimited quota
+    if not row.nr_groups or row.min_quota == 0:
+        return -1
 
-            if user.transcribed_seconds < group.transcription_quota:
-                return group.transcription_quota - user.transcribed_seconds
+    transcribed_seconds = row.transcribed_seconds or 0
 
-        return 0
+    return max(row.max_quota - transcribed_seconds, 0)
 
 
 def user_get_notifications(user_id: str, notification: str) -> Optional[str]:
@@ -740,6 +1057,7 @@ def user_get_notifications(user_id: str, notification: str) -> Optional[str]:
 
     Parameters:
         user_id (str): The user ID.
+        notification (str): The notification type to check.
 
     Returns:
         Optional[str]: The email associated with the user_id if the notification
@@ -769,7 +1087,18 @@ def users_admin_domains_from_realm(realm: str) -> list:
         list: A list of users which have the realm in their admin_domains.
     """
 
+    if (admins := admin_cache.get(realm)) is not None:
+        return list(admins)
+
     with get_session() as session:
-        users = session.query(User).filter(User.admin_domains.ilike(realm)).all()
+        users = (
+            session.query(User)
+            .join(UserAdminDomain, UserAdminDomain.user_id == User.id)
+            .filter(UserAdminDomain.domain == realm.lower())
+            .all()
+        )
+        admins = [user.as_dict() for user in users]
+
+    admin_cache.set(realm, admins)
 
-        return [user.as_dict() for user in users]
+    return list(admins)
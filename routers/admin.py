@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import ORJSONResponse, Response
 from db.user import (
     user_get,
     users_statistics,
     user_get_all,
     user_update,
-    group_statistics,
+    group_statistics_bulk,
 )
 from db.group import (
     group_get,
@@ -15,6 +15,8 @@ from db.group import (
     group_delete,
     group_add_user,
     group_remove_user,
+    group_add_users_bulk,
+    group_remove_users_bulk,
 )
 from db.customer import (
     customer_create,
@@ -22,7 +24,7 @@ from db.customer import (
     customer_get_all,
     customer_update,
     customer_delete,
-    customer_get_statistics,
+    customer_get_statistics_bulk,
     get_all_realms,
     export_customers_to_csv,
 )
@@ -39,6 +41,7 @@ from utils.validators import (
     ModifyUserRequest,
     CreateGroupRequest,
     UpdateGroupRequest,
+    GroupUsersRequest,
     CreateCustomerRequest,
     UpdateCustomerRequest,
 )
@@ -48,63 +51,69 @@ router = APIRouter(tags=["admin"])
 settings = get_settings()
 
 
+def resolve_realm(admin_user: dict = Depends(get_current_admin_user)) -> str:
+    """
+    Resolve which realm the current admin user is allowed to see.
+    FastAPI caches dependencies per request, so the admin user is only
+    verified once even when a handler depends on both.
+
+    Parameters:
+        admin_user (dict): The current user.
+
+    Returns:
+        str: "*" for bofh users, otherwise the user's own realm.
+    """
+
+    return "*" if admin_user["bofh"] else admin_user["realm"]
+
+
 @router.get("/admin")
-async def statistics(
+def statistics(
     request: Request,
-    admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+    realm: str = Depends(resolve_realm),
+) -> ORJSONResponse:
     """
     Get user statistics.
     Used by the frontend to get user statistics.
 
     Parameters:
         request (Request): The incoming HTTP request.
-        admin_user (dict): The current user.
+        realm (str): The realm the admin user is allowed to see.
 
     Returns:
-        JSONResponse: The user statistics.
+        ORJSONResponse: The user statistics.
     """
 
-    if admin_user["bofh"]:
-        realm = "*"
-    else:
-        realm = admin_user["realm"]
-
-    return JSONResponse(content={"result": users_statistics(realm=realm)})
+    return ORJSONResponse(content={"result": users_statistics(realm=realm)})
 
 
 @router.get("/admin/users")
-async def list_users(
+def list_users(
     request: Request,
-    admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+    realm: str = Depends(resolve_realm),
+) -> ORJSONResponse:
     """
     List all users with statistics.
     Used by the frontend to list all users.
 
     Parameters:
         request (Request): The incoming HTTP request.
-        admin_user (dict): The current user.
+        realm (str): The realm the admin user is allowed to see.
 
     Returns:
-        JSONResponse: The list of users with statistics.
+        ORJSONResponse: The list of users with statistics.
     """
 
-    if admin_user["bofh"]:
-        realm = "*"
-    else:
-        realm = admin_user["realm"]
-
-    return JSONResponse(content={"result": user_get_all(realm=realm)})
+    return ORJSONResponse(content={"result": user_get_all(realm=realm)})
 
 
 @router.put("/admin/{username}")
-async def modify_user(
+def modify_user(
     request: Request,
     item: ModifyUserRequest,
     username: str,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Modify a user's active status.
     Used by the frontend to modify a user's active status.
@@ -115,89 +124,78 @@ async def modify_user(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The result of the operation.
+        ORJSONResponse: The result of the operation.
     """
+    if item.active is None and item.admin is None and item.admin_domains is None:
+        return ORJSONResponse(
+            content={"error": "No fields to update"},
+            status_code=400,
+        )
+
     if not (user_id := user_get(username=username)["user_id"]):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "User not found"},
             status_code=404,
         )
 
-    if item.active is not None:
-        user_update(
-            user_id,
-            active=item.active,
-        )
-
-    if item.admin is not None:
-        user_update(
-            user_id,
-            admin=item.admin,
-        )
-
-    if item.admin_domains is not None:
-        user_update(
-            user_id,
-            admin_domains=item.admin_domains,
-        )
+    # Unset fields are passed as None and left unchanged by user_update.
+    user_update(
+        user_id,
+        active=item.active,
+        admin=item.admin,
+        admin_domains=item.admin_domains,
+    )
 
-    return JSONResponse(content={"result": {"status": "OK"}})
+    return ORJSONResponse(content={"result": {"status": "OK"}})
 
 
 @router.get("/admin/groups")
-async def list_groups(
+def list_groups(
     request: Request,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+    realm: str = Depends(resolve_realm),
+) -> ORJSONResponse:
     """
     List all groups with statistics and member counts.
 
     Parameters:
         request (Request): The incoming HTTP request.
         admin_user (dict): The current user.
+        realm (str): The realm the admin user is allowed to see.
 
     Returns:
-        JSONResponse: The list of groups with statistics and member counts.
+        ORJSONResponse: The list of groups with statistics and member counts.
     """
 
-    if admin_user["bofh"]:
-        realm = "*"
-    else:
-        realm = admin_user["realm"]
-
     groups = group_get_all(admin_user["user_id"], realm=realm)
-    result = []
-
-    for g in groups:
-        stats = group_statistics(str(g["id"]), admin_user["user_id"], realm)
-
-        if g["name"] == "All users":
-            g["nr_users"] = stats["total_users"]
-
-        group_dict = {
+    stats_by_id = group_statistics_bulk(
+        [g["id"] for g in groups], admin_user["user_id"], realm
+    )
+    result = [
+        {
             "id": g["id"],
             "name": g["name"],
-            "customer_name": g.get("customer_name", "None"),
+            "customer_name": g["customer_name"],
             "realm": g["realm"],
             "description": g["description"],
             "created_at": g["created_at"],
             "users": g["users"],
-            "nr_users": stats["total_users"],
-            "stats": stats,
+            "nr_users": g["nr_users"],
+            "stats": stats_by_id[str(g["id"])],
             "quota_seconds": g["quota_seconds"],
         }
+        for g in groups
+    ]
 
-        result.append(group_dict)
-
-    return JSONResponse(content={"result": result})
+    return ORJSONResponse(content={"result": result})
 
 
 @router.post("/admin/groups")
-async def create_group(
+def create_group(
     request: Request,
     item: CreateGroupRequest,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create a new group.
 
@@ -206,11 +204,11 @@ async def create_group(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The result of the operation.
+        ORJSONResponse: The result of the operation.
     """
 
     if not item.name:
-        return JSONResponse(content={"error": "Missing group name"}, status_code=400)
+        return ORJSONResponse(content={"error": "Missing group name"}, status_code=400)
 
     group = group_create(
         name=item.name,
@@ -221,19 +219,21 @@ async def create_group(
     )
 
     if not group:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "Failed to create group"}, status_code=500
         )
 
-    return JSONResponse(content={"result": {"id": group["id"], "name": group["name"]}})
+    return ORJSONResponse(
+        content={"result": {"id": group["id"], "name": group["name"]}}
+    )
 
 
 @router.get("/admin/groups/{group_id}")
-async def get_group(
+def get_group(
     request: Request,
     group_id: str,
     admin_user: dict = Depends(get_current_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get group details.
 
@@ -243,7 +243,7 @@ async def get_group(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The group details.
+        ORJSONResponse: The group details.
     """
 
     if admin_user["bofh"]:
@@ -254,18 +254,18 @@ async def get_group(
     group = group_get(group_id, realm=realm, user_id=admin_user["user_id"])
 
     if not group:
-        return JSONResponse(content={"error": "Group not found"}, status_code=404)
+        return ORJSONResponse(content={"error": "Group not found"}, status_code=404)
 
-    return JSONResponse(content={"result": group})
+    return ORJSONResponse(content={"result": group})
 
 
 @router.put("/admin/groups/{group_id}")
-async def update_group(
+def update_group(
     request: Request,
     item: UpdateGroupRequest,
     group_id: str,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Update group details (name/description).
 
@@ -275,7 +275,7 @@ async def update_group(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The result of the operation.
+        ORJSONResponse: The result of the operation.
     """
 
     try:
@@ -286,19 +286,19 @@ async def update_group(
             usernames=item.usernames,
             quota_seconds=int(item.quota),
         ):
-            return JSONResponse(content={"error": "Group not found"}, status_code=404)
+            return ORJSONResponse(content={"error": "Group not found"}, status_code=404)
     except ValueError as e:
-        return JSONResponse(content={"error": str(e)}, status_code=400)
+        return ORJSONResponse(content={"error": str(e)}, status_code=400)
 
-    return JSONResponse(content={"result": {"status": "ok"}})
+    return ORJSONResponse(content={"result": {"status": "ok"}})
 
 
 @router.delete("/admin/groups/{group_id}")
-async def delete_group(
+def delete_group(
     request: Request,
     group_id: int,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Delete a group.
 
@@ -308,22 +308,76 @@ async def delete_group(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The result of the operation.
+        ORJSONResponse: The result of the operation.
     """
 
     if not group_delete(group_id):
-        return JSONResponse(content={"error": "Group not found"}, status_code=404)
+        return ORJSONResponse(content={"error": "Group not found"}, status_code=404)
+
+    return ORJSONResponse(content={"result": {"status": "OK"}})
+
+
+@router.post("/admin/groups/{group_id}/users")
+def add_users_to_group(
+    request: Request,
+    group_id: int,
+    item: GroupUsersRequest,
+    admin_user: dict = Depends(get_current_admin_user),
+) -> ORJSONResponse:
+    """
+    Add several users to a group at once.
+
+    Parameters:
+        request (Request): The incoming HTTP request.
+        group_id (int): The ID of the group.
+        item (GroupUsersRequest): The usernames of the users to add.
+        admin_user (dict): The current user.
+
+    Returns:
+        ORJSONResponse: The result of the operation.
+    """
+
+    if (result := group_add_users_bulk(group_id, item.usernames)) is None:
+        return ORJSONResponse(content={"error": "Group not found"}, status_code=404)
+
+    return ORJSONResponse(
+        content={"result": {"status": "OK", "added": len(result["user_ids"])}}
+    )
+
+
+@router.delete("/admin/groups/{group_id}/users")
+def remove_users_from_group(
+    request: Request,
+    group_id: int,
+    item: GroupUsersRequest,
+    admin_user: dict = Depends(get_current_admin_user),
+) -> ORJSONResponse:
+    """
+    Remove several users from a group at once.
 
-    return JSONResponse(content={"result": {"status": "OK"}})
+    Parameters:
+        request (Request): The incoming HTTP request.
+        group_id (int): The ID of the group.
+        item (GroupUsersRequest): The usernames of the users to remove.
+        admin_user (dict): The current user.
+
+    Returns:
+        ORJSONResponse: The result of the operation.
+    """
+
+    if (removed := group_remove_users_bulk(group_id, item.usernames)) is None:
+        return ORJSONResponse(content={"error": "Group not found"}, status_code=404)
+
+    return ORJSONResponse(content={"result": {"status": "OK", "removed": removed}})
 
 
 @router.post("/admin/groups/{group_id}/users/{username}")
-async def add_user_to_group(
+def add_user_to_group(
     request: Request,
     group_id: int,
     username: str,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Add a user to a group.
 
@@ -334,24 +388,24 @@ async def add_user_to_group(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The result of the operation.
+        ORJSONResponse: The result of the operation.
     """
 
     if not group_add_user(group_id, username):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "User or group not found"}, status_code=404
         )
 
-    return JSONResponse(content={"result": {"status": "OK"}})
+    return ORJSONResponse(content={"result": {"status": "OK"}})
 
 
 @router.delete("/admin/groups/{group_id}/users/{username}")
-async def remove_user_from_group(
+def remove_user_from_group(
     request: Request,
     group_id: int,
     username: str,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Remove a user from a group.
 
@@ -362,23 +416,24 @@ async def remove_user_from_group(
         username (str): The username of the user to remove.
 
     Returns:
-        JSONResponse: The result of the operation.
+        ORJSONResponse: The result of the operation.
     """
 
     if not group_remove_user(group_id, username):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "User or group not found"}, status_code=404
         )
 
-    return JSONResponse(content={"result": {"status": "OK"}})
+    return ORJSONResponse(content={"result": {"status": "OK"}})
 
 
 @router.get("/admin/groups/{group_id}/stats")
-async def group_stats(
+def group_stats(
     request: Request,
     group_id: str,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+    realm: str = Depends(resolve_realm),
+) -> ORJSONResponse:
     """
     Get group statistics.
 
@@ -386,22 +441,18 @@ async def group_stats(
         request (Request): The incoming HTTP request.
         group_id (str): The ID of the group.
         admin_user (dict): The current user.
+        realm (str): The realm the admin user is allowed to see.
 
     Returns:
-        JSONResponse: The group statistics.
+        ORJSONResponse: The group statistics.
     """
 
-    if admin_user["bofh"]:
-        realm = "*"
-    else:
-        realm = admin_user["realm"]
-
     group = group_get(group_id, realm=realm, user_id=admin_user["user_id"])
 
     if not group:
-        return JSONResponse(content={"error": "Group not found"}, status_code=404)
+        return ORJSONResponse(content={"error": "Group not found"}, status_code=404)
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "result": users_statistics(
                 group_id, realm=realm, user_id=admin_user["user_id"]
@@ -411,10 +462,10 @@ async def group_stats(
 
 
 @router.get("/admin/customers", include_in_schema=False)
-async def list_customers(
+def list_customers(
     request: Request,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     List all customers with statistics.
 
@@ -423,27 +474,27 @@ async def list_customers(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The list of customers with statistics.
+        ORJSONResponse: The list of customers with statistics.
     """
 
     customers = customer_get_all(admin_user)
+    stats_by_id = customer_get_statistics_bulk(
+        [customer["id"] for customer in customers]
+    )
+    result = [
+        {**customer, "stats": stats_by_id[str(customer["id"])]}
+        for customer in customers
+    ]
 
-    result = []
-
-    for customer in customers:
-        stats = customer_get_statistics(customer["id"])
-        customer["stats"] = stats
-        result.append(customer)
-
-    return JSONResponse(content={"result": result})
+    return ORJSONResponse(content={"result": result})
 
 
 @router.post("/admin/customers", include_in_schema=False)
-async def create_customer(
+def create_customer(
     request: Request,
     item: CreateCustomerRequest,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create a new customer.
 
@@ -452,14 +503,14 @@ async def create_customer(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The result of the operation.
+        ORJSONResponse: The result of the operation.
     """
 
     if not admin_user["bofh"]:
-        return JSONResponse(content={"error": "User not authorized"}, status_code=403)
+        return ORJSONResponse(content={"error": "User not authorized"}, status_code=403)
 
     if not item.partner_id or not item.name:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "Missing required fields"}, status_code=400
         )
 
@@ -475,15 +526,15 @@ async def create_customer(
         blocks_purchased=item.blocks_purchased,
     )
 
-    return JSONResponse(content={"result": customer})
+    return ORJSONResponse(content={"result": customer})
 
 
 @router.get("/admin/customers/{customer_id}", include_in_schema=False)
-async def get_customer(
+def get_customer(
     request: Request,
     customer_id: str,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get customer details.
 
@@ -493,22 +544,22 @@ async def get_customer(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The customer details.
+        ORJSONResponse: The customer details.
     """
 
     if not (customer := customer_get(customer_id)):
-        return JSONResponse(content={"error": "Customer not found"}, status_code=404)
+        return ORJSONResponse(content={"error": "Customer not found"}, status_code=404)
 
-    return JSONResponse(content={"result": customer})
+    return ORJSONResponse(content={"result": customer})
 
 
 @router.put("/admin/customers/{customer_id}", include_in_schema=False)
-async def update_customer(
+def update_customer(
     request: Request,
     item: UpdateCustomerRequest,
     customer_id: str,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Update customer details.
 
@@ -518,11 +569,11 @@ async def update_customer(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The updated customer details.
+        ORJSONResponse: The updated customer details.
     """
 
     if not admin_user["bofh"]:
-        return JSONResponse(content={"error": "User not authorized"}, status_code=403)
+        return ORJSONResponse(content={"error": "User not authorized"}, status_code=403)
 
     customer = customer_update(
         customer_id,
@@ -538,17 +589,17 @@ async def update_customer(
     )
 
     if not customer:
-        return JSONResponse(content={"error": "Customer not found"}, status_code=404)
+        return ORJSONResponse(content={"error": "Customer not found"}, status_code=404)
 
-    return JSONResponse(content={"result": customer})
+    return ORJSONResponse(content={"result": customer})
 
 
 @router.delete("/admin/customers/{customer_id}", include_in_schema=False)
-async def delete_customer(
+def delete_customer(
     request: Request,
     customer_id: int,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Delete a customer.
 
@@ -558,23 +609,23 @@ async def delete_customer(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The result of the operation.
+        ORJSONResponse: The result of the operation.
     """
 
     if not admin_user["bofh"]:
-        return JSONResponse(content={"error": "User not authorized"}, status_code=403)
+        return ORJSONResponse(content={"error": "User not authorized"}, status_code=403)
 
     if not customer_delete(customer_id):
-        return JSONResponse(content={"error": "Customer not found"}, status_code=404)
+        return ORJSONResponse(content={"error": "Customer not found"}, status_code=404)
 
-    return JSONResponse(content={"result": {"status": "OK"}})
+    return ORJSONResponse(content={"result": {"status": "OK"}})
 
 
 @router.get("/admin/realms", include_in_schema=False)
-async def list_realms(
+def list_realms(
     request: Request,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     List all unique realms.
 
@@ -583,21 +634,21 @@ async def list_realms(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The list of unique realms.
+        ORJSONResponse: The list of unique realms.
     """
 
     if not admin_user["bofh"]:
-        return JSONResponse(content={"error": "User not authorized"}, status_code=403)
+        return ORJSONResponse(content={"error": "User not authorized"}, status_code=403)
 
-    return JSONResponse(content={"result": get_all_realms()})
+    return ORJSONResponse(content={"result": get_all_realms()})
 
 
 @router.get("/admin/customers/{customer_id}/stats", include_in_schema=False)
-async def customer_stats(
+def customer_stats(
     request: Request,
     customer_id: str,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get detailed customer statistics.
 
@@ -607,20 +658,23 @@ async def customer_stats(
         admin_user (dict): The current user.
 
     Returns:
-        JSONResponse: The customer statistics.
+        ORJSONResponse: The customer statistics.
     """
 
     if not admin_user["bofh"] and not admin_user["admin"]:
-        return JSONResponse(content={"error": "User not authorized"}, status_code=403)
+        return ORJSONResponse(content={"error": "User not authorized"}, status_code=403)
 
-    if not customer_get(customer_id):
-        return JSONResponse(content={"error": "Customer not found"}, status_code=404)
+    # Customers which don't exist are left out of the bulk statistics. The
+    # result is keyed by the row id, which is not necessarily spelled like
+    # the customer_id in the path, e.g. "007".
+    if not (stats := list(customer_get_statistics_bulk([customer_id]).values())):
+        return ORJSONResponse(content={"error": "Customer not found"}, status_code=404)
 
-    return JSONResponse(content={"result": customer_get_statistics(customer_id)})
+    return ORJSONResponse(content={"result": stats[0]})
 
 
 @router.get("/admin/customers/export/csv")
-async def export_customers_csv(
+def export_customers_csv(
     request: Request,
     admin_user: dict = Depends(get_current_admin_user),
 ):
@@ -636,10 +690,10 @@ async def export_customers_csv(
     """
 
     if not admin_user["bofh"] and not admin_user["admin"]:
-        return JSONResponse(content={"error": "User not authorized"}, status_code=403)
+        return ORJSONResponse(content={"error": "User not authorized"}, status_code=403)
 
     if not (csv_data := export_customers_to_csv(admin_user).encode("utf-8")):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "No customer data to export"}, status_code=404
         )
 
@@ -4,7 +4,7 @@ import requests
 from pathlib import Path
 from typing import Optional
 from fastapi import APIRouter, Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.concurrency import run_in_threadpool
 from db.job import (
     job_create,
@@ -39,7 +39,7 @@ async def get_job_external(
     external_id: str = "",
     status: Optional[JobStatus] = None,
     client_dn: str = Depends(verify_client_dn),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get job by external id.
 
@@ -51,14 +51,14 @@ async def get_job_external(
         status (Optional[JobStatus]): Filter jobs by status.
 
     Returns:
-        JSONResponse: The job status.
+        ORJSONResponse: The job status.
     """
 
     res = job_get_by_external_id(external_id, client_dn)
 
     if not isinstance(res, dict) and res and res["status"] == "completed":
         logger.error(f"External job not found: {external_id}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "result": res
             },
@@ -66,7 +66,7 @@ async def get_job_external(
 
     if not (job_result := job_result_get_external(external_id)):
         logger.error(f"External job result not found: {external_id}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "result": res
             },
@@ -81,7 +81,7 @@ async def get_job_external(
         )
     except Exception as e:
         logger.error(f"Error deserializing private key for external job result: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "result": {"error": "Error processing job result"}
             },
@@ -94,14 +94,14 @@ async def get_job_external(
 
     logger.info(f"Returning external job result for: {external_id}")
 
-    return JSONResponse(content={"result": res})
+    return ORJSONResponse(content={"result": res})
 
 @router.delete("/transcriber/external/{external_id}", include_in_schema=False)
 async def delete_external_transcription_job(
     request: Request,
     external_id: str,
     client_dn: str = Depends(verify_client_dn),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Delete an external transcription job.
     Used by integrations to clean up completed/failed jobs.
@@ -111,12 +111,12 @@ async def delete_external_transcription_job(
         external_id (str): The external ID of the job to delete.
 
     Returns:
-        JSONResponse: The result of the deletion.
+        ORJSONResponse: The result of the deletion.
     """
     job = job_get_by_external_id(external_id, client_dn)
 
     if not job:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "Job not found"}}, status_code=404
         )
 
@@ -132,7 +132,7 @@ async def delete_external_transcription_job(
     if file_path.exists():
         file_path.unlink()
 
-    return JSONResponse(content={"result": {"status": "OK"}})
+    return ORJSONResponse(content={"result": {"status": "OK"}})
 
 
 @router.post("/transcriber/external", include_in_schema=False)
@@ -140,7 +140,7 @@ async def transcribe_external_file(
     item: TranscribeExternalPost,
     request: Request,
     client_dn: str = Depends(verify_client_dn),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Transcribe audio file.
 
@@ -150,7 +150,7 @@ async def transcribe_external_file(
         request (Request): The incoming HTTP request.
 
     Returns:
-        JSONResponse: The job status.
+        ORJSONResponse: The job status.
 
     Raise:
         Exception: If there is an error during processing.
@@ -192,7 +192,7 @@ async def transcribe_external_file(
             file_path.mkdir(parents=True, exist_ok=True)
 
         if not (api_user := user_get(username="api_user")):
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"result": {"error": "API user not found"}}, status_code=500
             )
 
@@ -212,11 +212,11 @@ async def transcribe_external_file(
             job = job_update(
                 job["uuid"], item.user_id, status=JobStatusEnum.FAILED, error=str(e)
             )
-        return JSONResponse(content={"result": {"error": str(e)}}, status_code=500)
+        return ORJSONResponse(content={"result": {"error": str(e)}}, status_code=500)
 
     job = job_update(job["uuid"], status=JobStatusEnum.PENDING)
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "result": {
                 "uuid": job["uuid"],
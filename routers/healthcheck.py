@@ -1,7 +1,7 @@
 from auth.client import verify_client_dn
 from auth.oidc import get_current_admin_user
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from utils.health import HealthStatus
 
 router = APIRouter(tags=["healthcheck"])
@@ -12,7 +12,7 @@ health = HealthStatus()
 async def healthcheck(
     request: Request,
     client_dn: str = Depends(verify_client_dn),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Recevice a JSON blob with system data from the GPU workers.
 
@@ -20,21 +20,21 @@ async def healthcheck(
         request (Request): The incoming HTTP request.
 
     Returns:
-        JSONResponse: The result of the health check.
+        ORJSONResponse: The result of the health check.
     """
 
     data = await request.json()
 
     health.add(data)
 
-    return JSONResponse(content={"result": "ok"})
+    return ORJSONResponse(content={"result": "ok"})
 
 
 @router.get("/healthcheck", include_in_schema=False)
 async def get_healthcheck(
     request: Request,
     admin_user: dict = Depends(get_current_admin_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get the health status of all workers.
 
@@ -43,15 +43,15 @@ async def get_healthcheck(
         user_id (str): The ID of the user.
 
     Returns:
-        JSONResponse: The health status of all workers.
+        ORJSONResponse: The health status of all workers.
     """
 
     if not admin_user["bofh"]:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "User not authorized"},
             status_code=403,
         )
 
     data = health.get()
 
-    return JSONResponse(content={"result": data})
+    return ORJSONResponse(content={"result": data})
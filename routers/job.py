@@ -3,7 +3,7 @@ import json
 from auth.client import dn_in_list, verify_client_dn
 from fastapi import APIRouter, UploadFile, Request, Depends
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from db.job import (
     job_get,
     job_get_next,
@@ -45,7 +45,7 @@ async def update_transcription_status(
     item: TranscriptionJobUpdateRequest,
     job_id: str,
     client_dn: str = Depends(verify_client_dn),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Update the status of a transcription job.
 
@@ -54,7 +54,7 @@ async def update_transcription_status(
         job_id (str): The ID of the job to update.
 
     Returns:
-        JSONResponse: The updated job status.
+        ORJSONResponse: The updated job status.
     """
 
     user_id = user_get_from_job(job_id)
@@ -74,7 +74,7 @@ async def update_transcription_status(
     )
 
     if not job:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "Job not found"}}, status_code=404
         )
 
@@ -82,9 +82,10 @@ async def update_transcription_status(
         if not user_update(
             user_id,
             transcribed_seconds=item.transcribed_seconds,
+            job_type=job["job_type"],
             active=None,
         ):
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"result": {"error": "User not found"}}, status_code=404
             )
 
@@ -103,14 +104,14 @@ async def update_transcription_status(
         if file_path.exists():
             file_path.unlink()
 
-    return JSONResponse(content={"result": job})
+    return ORJSONResponse(content={"result": job})
 
 
 @router.get("/job/next", include_in_schema=False)
 async def get_transcription_job(
     request: Request,
     client_dn: str = Depends(verify_client_dn),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get the next available job.
 
@@ -118,10 +119,10 @@ async def get_transcription_job(
         request (Request): The incoming HTTP request.
 
     Returns:
-        JSONResponse: The next available job.
+        ORJSONResponse: The next available job.
     """
 
-    return JSONResponse(content={"result": jsonable_encoder(job_get_next())})
+    return ORJSONResponse(content={"result": jsonable_encoder(job_get_next())})
 
 
 @router.get("/job/{user_id}/{job_id}/file", include_in_schema=False)
@@ -144,21 +145,21 @@ async def get_transcription_file(
     """
 
     if not job_get(job_id, user_id):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "Job not found"}}, status_code=404
         )
 
     file_path = Path(settings.API_FILE_STORAGE_DIR) / user_id / job_id
 
     if not file_path.exists():
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "File not found"}}, status_code=404
         )
 
     api_user = user_get(username="api_user")
 
     if not api_user:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "API user not found"}}, status_code=500
         )
 
@@ -186,7 +187,7 @@ async def put_video_file(
     job_id: str,
     file: UploadFile,
     client_dn: str = Depends(verify_client_dn),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Upload the video file to transcribe.
 
@@ -197,13 +198,13 @@ async def put_video_file(
         file (UploadFile): The uploaded file.
 
     Returns:
-        JSONResponse: The result of the upload.
+        ORJSONResponse: The result of the upload.
     """
 
     filename = file.filename + ".enc"
 
     if not job_get(job_id, user_id):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "Job not found"}}, status_code=404
         )
 
@@ -227,7 +228,7 @@ async def put_video_file(
         chunk_size=settings.CRYPTO_CHUNK_SIZE,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "result": {
                 "uuid": job_id,
@@ -246,7 +247,7 @@ async def put_transcription_result(
     user_id: str,
     job_id: str,
     client_dn: str = Depends(verify_client_dn),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Upload the transcription result.
 
@@ -256,11 +257,11 @@ async def put_transcription_result(
         job_id (str): The ID of the job.
 
     Returns:
-        JSONResponse: The result of the upload.
+        ORJSONResponse: The result of the upload.
     """
 
     if not (job := job_get(job_id, user_id)):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "Job not found"}}, status_code=404
         )
 
@@ -290,7 +291,7 @@ async def put_transcription_result(
         case "mp4":
             pass
         case _:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"result": {"error": "Unsupported format"}}, status_code=400
             )
 
@@ -300,7 +301,7 @@ async def put_transcription_result(
         error=None,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "result": {
                 "uuid": job["uuid"],
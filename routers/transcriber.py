@@ -1,5 +1,5 @@
 from fastapi import APIRouter, UploadFile, Request, Depends, Query, File
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from db.job import (
     job_create,
     job_remove,
@@ -43,7 +43,7 @@ async def transcribe(
     request: Request,
     job_id: Optional[str] = Query(None, description="The ID of the job to get"),
     user: dict = Depends(get_current_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Transcribe audio file.
 
@@ -56,7 +56,7 @@ async def transcribe(
         user (dict): The current user.
 
     Returns:
-        JSONResponse: The job status or list of jobs.
+        ORJSONResponse: The job status or list of jobs.
     """
 
     if job_id:
@@ -64,7 +64,7 @@ async def transcribe(
     else:
         res = job_get_all(user["user_id"])
 
-    return JSONResponse(content={"result": res})
+    return ORJSONResponse(content={"result": res})
 
 
 @router.post("/transcriber")
@@ -72,7 +72,7 @@ async def transcribe_file(
     request: Request,
     file: UploadFile = File(...),
     user: dict = Depends(get_current_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Transcribe audio file.
 
@@ -84,7 +84,7 @@ async def transcribe_file(
         user (dict): The current user.
 
     Returns:
-        JSONResponse: The job status.
+        ORJSONResponse: The job status.
     """
 
     job = job_create(
@@ -94,7 +94,7 @@ async def transcribe_file(
     )
 
     if not (api_user := user_get(username="api_user")):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "API user not found"}}, status_code=500
         )
 
@@ -122,9 +122,9 @@ async def transcribe_file(
         job = job_update(
             job["uuid"], user["user_id"], status=JobStatusEnum.FAILED, error=str(e)
         )
-        return JSONResponse(content={"result": {"error": str(e)}}, status_code=500)
+        return ORJSONResponse(content={"result": {"error": str(e)}}, status_code=500)
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "result": {
                 "uuid": job["uuid"],
@@ -142,7 +142,7 @@ async def delete_transcription_job(
     request: Request,
     job_id: str,
     user: dict = Depends(get_current_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Delete a transcription job.
 
@@ -154,11 +154,11 @@ async def delete_transcription_job(
         user (dict): The current user.
 
     Returns:
-        JSONResponse: The result of the deletion.
+        ORJSONResponse: The result of the deletion.
     """
 
     if not job_get(job_id, user["user_id"]):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "Job not found"}}, status_code=404
         )
 
@@ -175,7 +175,7 @@ async def delete_transcription_job(
     if file_path_enc.exists():
         file_path_enc.unlink()
 
-    return JSONResponse(content={"result": {"status": "OK"}})
+    return ORJSONResponse(content={"result": {"status": "OK"}})
 
 
 @router.put("/transcriber/{job_id}")
@@ -184,7 +184,7 @@ async def update_transcription_status(
     item: TranscriptionStatusPut,
     job_id: str,
     user: dict = Depends(get_current_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Update the status of a transcription job.
 
@@ -196,13 +196,13 @@ async def update_transcription_status(
         user (dict): The current user.
 
     Returns:
-        JSONResponse: The updated job status.
+        ORJSONResponse: The updated job status.
     """
 
     quota_left = user_get_quota_left(user["user_id"])
 
     if not quota_left:
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "result": {
                     "error": "Quota exceeded, please contact your administrator."
@@ -223,11 +223,11 @@ async def update_transcription_status(
             error=None,
         )
     ):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "Job not found"}}, status_code=404
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "result": {
                 "uuid": job["uuid"],
@@ -249,7 +249,7 @@ async def put_transcription_result(
     item: TranscriptionResultPut,
     job_id: str,
     user: dict = Depends(get_current_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Upload the transcription result.
 
@@ -259,11 +259,11 @@ async def put_transcription_result(
         user (dict): The current user.
 
     Returns:
-        JSONResponse: The result of the upload.
+        ORJSONResponse: The result of the upload.
     """
     try:
         if not job_get(job_id, user["user_id"]):
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"result": {"error": "Job not found"}}, status_code=404
             )
 
@@ -285,9 +285,9 @@ async def put_transcription_result(
                 )
     except Exception as e:
         print(e)
-        return JSONResponse(content={"result": {"error": str(e)}}, status_code=500)
+        return ORJSONResponse(content={"result": {"error": str(e)}}, status_code=500)
 
-    return JSONResponse(content={"result": {"status": "OK"}}, status_code=200)
+    return ORJSONResponse(content={"result": {"status": "OK"}}, status_code=200)
 
 
 @router.get("/transcriber/{job_id}/result/{output_format}")
@@ -296,7 +296,7 @@ async def get_transcription_result(
     job_id: str,
     output_format: OutputFormatEnum,
     user: dict = Depends(get_current_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get the transcription result.
 
@@ -307,7 +307,7 @@ async def get_transcription_result(
         user (dict): The current user.
 
     Returns:
-        JSONResponse: The transcription result.
+        ORJSONResponse: The transcription result.
     """
 
     data = await request.json()
@@ -318,7 +318,7 @@ async def get_transcription_result(
         encrypted_result = False
 
     if not (job_result := job_result_get(user["user_id"], job_id)):
-        return JSONResponse(
+        return ORJSONResponse(
             content={"result": {"error": "Job result not found"}}, status_code=404
         )
 
@@ -354,12 +354,12 @@ async def get_transcription_result(
         case OutputFormatEnum.CSV:
             pass
         case _:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"result": {"error": "Unsupported output format"}},
                 status_code=400,
             )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={"result": content},
         media_type="text/plain",
     )
@@ -5,7 +5,7 @@ from db.user import (
 )
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from utils.log import get_logger
 from utils.settings import get_settings
 from utils.crypto import validate_private_key_password
@@ -22,7 +22,7 @@ api_file_storage_dir = settings.API_FILE_STORAGE_DIR
 async def get_user_info(
     request: Request,
     user: dict = Depends(get_current_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get user information.
     Used by the frontend to get user information.
@@ -32,17 +32,17 @@ async def get_user_info(
         user (dict): The current user.
 
     Returns:
-        JSONResponse: The user information.
+        ORJSONResponse: The user information.
     """
 
-    return JSONResponse(content={"result": user})
+    return ORJSONResponse(content={"result": user})
 
 
 @router.put("/me")
 async def set_user_info(
     item: UserUpdateRequest,
     user: dict = Depends(get_current_user),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Set user information.
     Used by the frontend to set user information.
@@ -52,7 +52,7 @@ async def set_user_info(
         user (dict): The current user.
 
     Returns:
-        JSONResponse:  The result of the operation.
+        ORJSONResponse:  The result of the operation.
     """
 
     if item.encryption and item.encryption_password:
@@ -67,7 +67,7 @@ async def set_user_info(
         private_key = user_get_private_key(user["user_id"])
 
         if not validate_private_key_password(private_key, item.encryption_password):
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"error": "Invalid encryption password"},
                 status_code=403,
             )
@@ -94,4 +94,4 @@ async def set_user_info(
 
         user_update(user["user_id"], notifications_str=notifications_str)
 
-    return JSONResponse(content={"result": {"status": "OK"}})
+    return ORJSONResponse(content={"result": {"status": "OK"}})
@@ -2,7 +2,7 @@ from auth.oidc import get_current_user
 from db.job import job_get
 from db.user import user_get_private_key
 from fastapi import APIRouter, Depends, Header, Request
-from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pathlib import Path
 from utils.crypto import (
     decrypt_data_from_file,
@@ -56,10 +56,10 @@ async def get_video_stream(
         encrypted_media = False
 
     if not job:
-        return JSONResponse({"result": {"error": "Job not found"}}, status_code=404)
+        return ORJSONResponse({"result": {"error": "Job not found"}}, status_code=404)
 
     if not file_path.exists():
-        return JSONResponse(
+        return ORJSONResponse(
             {"result": {"error": "Video file not found"}}, status_code=404
         )
 
@@ -93,7 +93,7 @@ async def get_video_stream(
         )
 
         if filesize_actual == 0:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"result": {"error": "Encrypted file is empty or corrupted"}},
                 status_code=500,
             )
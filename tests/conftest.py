@@ -0,0 +1,62 @@
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+# The settings and the database engine are created when the application
+# modules are imported, point them at a throwaway SQLite database first.
+TEST_DIR = tempfile.mkdtemp(prefix="transcribe-backend-tests-")
+
+os.environ["API_DATABASE_URL"] = f"sqlite:///{TEST_DIR}/test.db"
+os.environ["API_FILE_STORAGE_DIR"] = f"{TEST_DIR}/files"
+os.environ.setdefault("OIDC_SCOPE", "openid")
+
+
+@pytest.fixture
+def db():
+    """
+    Provide an empty database and empty caches for a test.
+    """
+
+    from sqlmodel import SQLModel
+
+    from db import customer, user
+    from db.session import get_session, get_sessionmaker
+
+    get_sessionmaker()
+
+    with get_session() as session:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            session.execute(table.delete())
+
+    for cache in (
+        user.user_cache,
+        user.admin_cache,
+        user.statistics_cache,
+        customer.partner_names_cache,
+        customer.export_cache,
+        customer.realms_cache,
+    ):
+        cache.clear()
+
+    yield
+
+
+def pytest_unconfigure(config):
+    """
+    Stop the notification queue poller once the tests are done. It
+    reschedules itself on a timer thread, which would otherwise keep the
+    test process from exiting.
+    """
+
+    while timers := [
+        thread
+        for thread in threading.enumerate()
+        if isinstance(thread, threading.Timer)
+    ]:
+        for timer in timers:
+            timer.cancel()
+
+        time.sleep(0.1)
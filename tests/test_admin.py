@@ -0,0 +1,106 @@
+import pytest
+
+from fastapi.testclient import TestClient
+
+from db.customer import customer_get_statistics_bulk
+from db.models import Customer, Group, GroupUserLink, User
+from db.session import get_session
+from utils.settings import get_settings
+
+settings = get_settings()
+
+ADMIN_USER = {
+    "user_id": "admin",
+    "username": "admin@a.se",
+    "realm": "a.se",
+    "admin": True,
+    "bofh": True,
+    "active": True,
+}
+
+
+@pytest.fixture
+def client(db):
+    from app import app
+    from auth.oidc import get_current_admin_user
+
+    app.dependency_overrides[get_current_admin_user] = lambda: ADMIN_USER
+
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+
+
+def group_members(group_id: int) -> set:
+    with get_session() as session:
+        return {
+            username
+            for (username,) in session.query(User.username)
+            .join(GroupUserLink, GroupUserLink.user_id == User.id)
+            .filter(GroupUserLink.group_id == group_id)
+        }
+
+
+def test_group_users_bulk_add_remove(client):
+    with get_session() as session:
+        group = Group(name="Group", realm="a.se")
+        session.add(group)
+        session.add_all(
+            User(user_id=f"u{i}", username=f"user{i}@a.se", realm="a.se")
+            for i in range(3)
+        )
+        session.flush()
+        group_id = group.id
+
+    url = f"{settings.API_PREFIX}/admin/groups/{group_id}/users"
+
+    response = client.post(
+        url, json={"usernames": ["user0@a.se", "user1@a.se", "missing@a.se"]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"result": {"status": "OK", "added": 2}}
+    assert group_members(group_id) == {"user0@a.se", "user1@a.se"}
+
+    # Users already in the group are skipped.
+    response = client.post(url, json={"usernames": ["user1@a.se", "user2@a.se"]})
+    assert response.json() == {"result": {"status": "OK", "added": 1}}
+    assert group_members(group_id) == {"user0@a.se", "user1@a.se", "user2@a.se"}
+
+    response = client.request(
+        "DELETE", url, json={"usernames": ["user0@a.se", "user2@a.se", "x@a.se"]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"result": {"status": "OK", "removed": 2}}
+    assert group_members(group_id) == {"user1@a.se"}
+
+
+def test_group_users_bulk_unknown_group(client):
+    url = f"{settings.API_PREFIX}/admin/groups/4711/users"
+
+    response = client.post(url, json={"usernames": ["user0@a.se"]})
+    assert response.status_code == 404
+
+    response = client.request("DELETE", url, json={"usernames": ["user0@a.se"]})
+    assert response.status_code == 404
+
+
+def test_customer_stats(client):
+    with get_session() as session:
+        customer = Customer(
+            customer_abbr="C", name="Customer", partner_id="1234", realms="a.se"
+        )
+        session.add(customer)
+        session.flush()
+        customer_id = customer.id
+
+    expected = customer_get_statistics_bulk([customer_id])[str(customer_id)]
+
+    for path_id in (str(customer_id), f"00{customer_id}"):
+        response = client.get(f"{settings.API_PREFIX}/admin/customers/{path_id}/stats")
+
+        assert response.status_code == 200
+        assert response.json()["result"] == expected
+
+    response = client.get(f"{settings.API_PREFIX}/admin/customers/4711/stats")
+
+    assert response.status_code == 404
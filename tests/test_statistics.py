@@ -0,0 +1,484 @@
+import pytest
+
+from datetime import datetime, timedelta
+
+from db.customer import customer_get_statistics_bulk
+from db.group import group_get_all
+from db.job import job_get_all
+from db.models import (
+    Customer,
+    Group,
+    GroupUserLink,
+    Job,
+    JobStatusEnum,
+    JobType,
+    User,
+)
+from db.session import get_session
+from db.user import group_statistics_bulk, users_statistics
+from utils.settings import get_settings
+
+settings = get_settings()
+
+USERS = [
+    # user_id, username, realm
+    ("u0", "alice@a.se", "a.se"),
+    ("u1", "bob@a.se", "a.se"),
+    ("u2", "1234", "reach"),
+    ("u3", "5678", "reach"),
+    ("u4", "carol@b.se", "b.se"),
+    ("u5", "dave@c.se", "c.se"),
+    ("u6", "erin@d.se", "d.se"),
+]
+
+STATUSES = [
+    JobStatusEnum.COMPLETED,
+    JobStatusEnum.DELETED,
+    JobStatusEnum.UPLOADED,
+    JobStatusEnum.IN_PROGRESS,
+    JobStatusEnum.FAILED,
+]
+
+
+def job_dates() -> list[datetime]:
+    """
+    Job creation times around the start of this and the previous month.
+    The old statistics parsed created_at with microseconds, so none of
+    them fall on a whole second.
+    """
+
+    now = datetime.utcnow()
+    first_this_month = datetime(now.year, now.month, 1)
+    first_prev_month = (first_this_month - timedelta(days=1)).replace(day=1)
+
+    return [
+        first_this_month + timedelta(microseconds=250000),
+        max(
+            first_this_month + timedelta(microseconds=750000),
+            (now - timedelta(minutes=1)).replace(microsecond=123456),
+        ),
+        first_this_month - timedelta(microseconds=500000),
+        first_prev_month + timedelta(microseconds=250000),
+        first_prev_month - timedelta(days=3, microseconds=-250000),
+    ]
+
+
+@pytest.fixture
+def populated(db):
+    with get_session() as session:
+        for user_id, username, realm in USERS:
+            session.add(
+                User(
+                    user_id=user_id,
+                    username=username,
+                    realm=realm,
+                    active=True,
+                    admin=user_id == "u0",
+                    admin_domains="a.se,reach" if user_id == "u0" else None,
+                    last_login=datetime(2025, 1, 1),
+                )
+            )
+
+        session.add_all(
+            [
+                Customer(
+                    customer_abbr="C",
+                    partner_id="1234",
+                    name="Customer",
+                    realms="a.se, b.se",
+                    priceplan="fixed",
+                    blocks_purchased=1,
+                ),
+                Customer(
+                    customer_abbr="S",
+                    partner_id="999",
+                    name="Small",
+                    realms="c.se",
+                    priceplan="fixed",
+                    blocks_purchased=100,
+                ),
+                Customer(
+                    customer_abbr="V",
+                    partner_id="555",
+                    name="Variable",
+                    realms="d.se",
+                    priceplan="variable",
+                ),
+                Customer(
+                    customer_abbr="E",
+                    partner_id="777",
+                    name="Empty",
+                    realms="",
+                    priceplan="fixed",
+                    blocks_purchased=2,
+                ),
+            ]
+        )
+
+        groups = {
+            name: Group(name=name, realm="a.se") for name in ("G1", "G2", "Empty")
+        }
+        session.add_all(groups.values())
+        session.flush()
+
+        user_ids = {
+            user.user_id: user.id for user in session.query(User.id, User.user_id)
+        }
+
+        for name, members in (("G1", ["u0", "u2", "u3"]), ("G2", ["u1", "u4"])):
+            session.add_all(
+                GroupUserLink(group_id=groups[name].id, user_id=user_ids[member])
+                for member in members
+            )
+
+        k = 0
+
+        for user_id, _, _ in USERS:
+            for created_at in job_dates():
+                for status in STATUSES:
+                    k += 1
+                    session.add(
+                        Job(
+                            uuid=f"job{k}",
+                            user_id=user_id,
+                            status=status,
+                            job_type=JobType.TRANSCRIPTION,
+                            created_at=created_at,
+                            updated_at=created_at,
+                            transcribed_seconds=997 * k,
+                            filename="file" if k % 3 else "",
+                        )
+                    )
+
+        return {name: str(group.id) for name, group in groups.items()}
+
+
+def reference_users_statistics(group_id: str, realm: str, user_id: str) -> dict:
+    """
+    The per user computation users_statistics did before the statistics
+    were grouped in SQL.
+    """
+
+    with get_session() as session:
+        admin_domains = (
+            session.query(User.admin_domains).filter(User.user_id == user_id).scalar()
+        )
+        domains = admin_domains.split(",") if admin_domains else []
+
+        if group_id == "0":
+            query = session.query(User)
+
+            if realm != "*":
+                query = query.filter(User.realm.in_(domains))
+
+            users = query.all()
+        else:
+            users = session.get(Group, group_id).users
+
+        partner_names = {
+            customer.partner_id: customer.name for customer in session.query(Customer)
+        }
+        users = [user.as_dict() for user in users]
+
+    today = datetime.utcnow().date()
+    first_this_month = today.replace(day=1)
+    last_prev_month = first_this_month - timedelta(days=1)
+    first_prev_month = last_prev_month.replace(day=1)
+
+    stats = {
+        "total_users": len(users),
+        "active_users": users,
+        "transcribed_files": 0,
+        "transcribed_files_last_month": 0,
+        "total_transcribed_minutes": 0,
+        "total_transcribed_minutes_last_month": 0,
+        "transcribed_minutes_per_day": {},
+        "transcribed_minutes_per_day_last_month": {
+            (first_prev_month + timedelta(days=i)).isoformat(): 0
+            for i in range(last_prev_month.day)
+        },
+        "transcribed_minutes_per_user": {},
+        "transcribed_minutes_per_user_last_month": {},
+        "job_queue": [],
+    }
+
+    day = first_this_month
+
+    while day.month == first_this_month.month:
+        stats["transcribed_minutes_per_day"][day.isoformat()] = 0
+        day += timedelta(days=1)
+
+    for user in users:
+        if user["username"].isdigit() and user["username"] in partner_names:
+            display_name = "(REACH) " + partner_names[user["username"]]
+        else:
+            display_name = user["username"]
+
+        for job in job_get_all(user["user_id"], cleaned=True)["jobs"]:
+            job_date = datetime.strptime(
+                job["created_at"], "%Y-%m-%d %H:%M:%S.%f"
+            ).date()
+
+            if job_date >= first_this_month:
+                suffix = ""
+            elif first_prev_month <= job_date <= last_prev_month:
+                suffix = "_last_month"
+            else:
+                continue
+
+            if job["status"] in ("completed", "deleted"):
+                minutes = job["transcribed_seconds"] / 60
+                per_user = stats["transcribed_minutes_per_user" + suffix]
+
+                stats["transcribed_files" + suffix] += 1
+                stats["total_transcribed_minutes" + suffix] += minutes
+                stats["transcribed_minutes_per_day" + suffix][
+                    job_date.isoformat()
+                ] += minutes
+                per_user[display_name] = per_user.get(display_name, 0) + minutes
+
+            if job["status"] in ("uploaded", "in_progress"):
+                stats["job_queue"].append(
+                    {
+                        "status": (
+                            "transcribing"
+                            if job["status"] == "in_progress"
+                            else job["status"]
+                        ),
+                        "created_at": job["created_at"],
+                        "updated_at": job["updated_at"],
+                        "job_id": job["uuid"],
+                        "username": display_name,
+                    }
+                )
+
+    return stats
+
+
+def reference_customer_statistics(customer_id: int) -> dict:
+    """
+    The per user computation customer_get_statistics did before the
+    statistics of all customers were fetched at once.
+    """
+
+    with get_session() as session:
+        customer = session.get(Customer, customer_id)
+        realms = [r.strip() for r in customer.realms.split(",") if r.strip()]
+        blocks_purchased = customer.blocks_purchased or 0
+        minutes_included = blocks_purchased * settings.CUSTOMER_MINUTES_PER_BLOCK
+        priceplan = customer.priceplan
+
+        if not realms:
+            users = []
+        else:
+            users = [
+                (user.user_id, user.username)
+                for user in session.query(User).filter(User.realm.in_(realms))
+            ]
+            users.extend(
+                (user.user_id, user.username)
+                for user in session.query(User).filter(
+                    User.username == customer.partner_id
+                )
+            )
+
+    today = datetime.utcnow().date()
+    first_this_month = today.replace(day=1)
+    last_prev_month = first_this_month - timedelta(days=1)
+    first_prev_month = last_prev_month.replace(day=1)
+
+    files = {"this": 0, "last": 0}
+    minutes = {"this": 0, "last": 0}
+    web_minutes = {"this": 0, "last": 0}
+    external_minutes = {"this": 0, "last": 0}
+
+    for user_id, username in users:
+        for job in job_get_all(user_id, cleaned=True)["jobs"]:
+            if job["status"] not in ("completed", "deleted"):
+                continue
+
+            job_date = datetime.strptime(
+                job["created_at"], "%Y-%m-%d %H:%M:%S.%f"
+            ).date()
+
+            if job_date >= first_this_month:
+                month = "this"
+            elif first_prev_month <= job_date <= last_prev_month:
+                month = "last"
+            else:
+                continue
+
+            files[month] += 1
+            minutes[month] += job["transcribed_seconds"] / 60
+
+            if username.isnumeric():
+                external_minutes[month] += job["transcribed_seconds"] / 60
+            else:
+                web_minutes[month] += job["transcribed_seconds"] / 60
+
+    blocks_consumed = 0
+    overage_minutes = 0
+    overage_minutes_last_month = 0
+    remaining_minutes = minutes_included if not realms else 0
+
+    if realms and priceplan == "fixed" and blocks_purchased > 0:
+        if minutes["this"] > minutes_included:
+            blocks_consumed = blocks_purchased
+            overage_minutes = minutes["this"] - minutes_included
+        else:
+            blocks_consumed = minutes["this"] / settings.CUSTOMER_MINUTES_PER_BLOCK
+            remaining_minutes = minutes_included - minutes["this"]
+
+        if web_minutes["last"] > 4000 * blocks_purchased:
+            overage_minutes_last_month = minutes["last"] - 4000 * blocks_purchased
+
+    return {
+        "total_users": len(users),
+        "transcribed_files": files["this"],
+        "transcribed_files_last_month": files["last"],
+        "transcribed_minutes": int(web_minutes["this"]),
+        "transcribed_minutes_external": int(external_minutes["this"]),
+        "transcribed_minutes_last_month": int(web_minutes["last"]),
+        "transcribed_minutes_external_last_month": int(external_minutes["last"]),
+        "total_transcribed_minutes": int(minutes["this"]),
+        "total_transcribed_minutes_last_month": int(minutes["last"]),
+        "blocks_purchased": blocks_purchased,
+        "blocks_consumed": round(blocks_consumed, 2),
+        "minutes_included": minutes_included,
+        "overage_minutes": int(overage_minutes),
+        "overage_minutes_last_month": int(overage_minutes_last_month),
+        "remaining_minutes": int(remaining_minutes),
+    }
+
+
+def condensed(stats: dict) -> dict:
+    return {
+        key: stats[key]
+        for key in (
+            "total_users",
+            "transcribed_files",
+            "transcribed_files_last_month",
+            "total_transcribed_minutes",
+            "total_transcribed_minutes_last_month",
+        )
+    }
+
+
+@pytest.mark.parametrize(
+    "group,realm",
+    [("0", "*"), ("0", "a.se"), ("G1", "*"), ("G2", "a.se"), ("Empty", "*")],
+)
+def test_users_statistics_matches_per_user_computation(populated, group, realm):
+    group_id = populated.get(group, group)
+
+    stats = users_statistics(group_id=group_id, realm=realm, user_id="u0")
+    expected = reference_users_statistics(group_id, realm, "u0")
+
+    def by_user_id(users):
+        return sorted(users, key=lambda user: user["user_id"])
+
+    def by_job_id(jobs):
+        return sorted(jobs, key=lambda job: job["job_id"])
+
+    assert stats["total_users"] == expected["total_users"]
+    assert by_user_id(stats["active_users"]) == by_user_id(expected["active_users"])
+    assert by_job_id(stats["job_queue"]) == by_job_id(expected["job_queue"])
+
+    for key in (
+        "transcribed_files",
+        "transcribed_files_last_month",
+        "total_transcribed_minutes",
+        "total_transcribed_minutes_last_month",
+        "transcribed_minutes_per_day",
+        "transcribed_minutes_per_day_last_month",
+        "transcribed_minutes_per_user",
+        "transcribed_minutes_per_user_last_month",
+    ):
+        assert stats[key] == pytest.approx(expected[key]), key
+
+
+def test_users_statistics_reach_display_names(populated):
+    stats = users_statistics(group_id=populated["G1"], realm="*", user_id="u0")
+
+    # 1234 is the partner ID of a customer, 5678 is not.
+    assert set(stats["transcribed_minutes_per_user"]) == {
+        "alice@a.se",
+        "(REACH) Customer",
+        "5678",
+    }
+    assert {job["username"] for job in stats["job_queue"]} == {
+        "alice@a.se",
+        "(REACH) Customer",
+        "5678",
+    }
+
+
+def test_users_statistics_queued_jobs(populated):
+    stats = users_statistics(group_id=populated["G2"], realm="*", user_id="u0")
+
+    # Uploaded and in progress jobs of both members from this and the
+    # previous month, but not from the month before.
+    assert len(stats["job_queue"]) == 2 * 4 * 2
+    assert {job["status"] for job in stats["job_queue"]} == {
+        "uploaded",
+        "transcribing",
+    }
+
+
+def test_users_statistics_empty_group(populated):
+    stats = users_statistics(group_id=populated["Empty"], realm="*", user_id="u0")
+
+    assert stats["total_users"] == 0
+    assert stats["active_users"] == []
+    assert stats["job_queue"] == []
+    assert stats["transcribed_files"] == 0
+    assert stats["total_transcribed_minutes"] == 0
+    assert set(stats["transcribed_minutes_per_day"].values()) == {0}
+
+
+def test_group_statistics_bulk_matches_per_group_computation(populated):
+    group_ids = ["0", populated["G1"], populated["G2"], populated["Empty"], "4711"]
+
+    stats = group_statistics_bulk(group_ids, "u0", "*")
+
+    assert set(stats) == set(group_ids)
+    assert stats["4711"] == {
+        "total_users": 0,
+        "transcribed_files": 0,
+        "transcribed_files_last_month": 0,
+        "total_transcribed_minutes": 0,
+        "total_transcribed_minutes_last_month": 0,
+    }
+
+    for group_id in group_ids[:-1]:
+        expected = condensed(reference_users_statistics(group_id, "*", "u0"))
+
+        assert stats[group_id] == pytest.approx(expected), group_id
+
+
+def test_customer_statistics_bulk_matches_per_customer_computation(populated):
+    with get_session() as session:
+        customer_ids = [customer_id for (customer_id,) in session.query(Customer.id)]
+
+    stats = customer_get_statistics_bulk(customer_ids + [4711])
+
+    assert set(stats) == {str(customer_id) for customer_id in customer_ids}
+
+    for customer_id in customer_ids:
+        expected = reference_customer_statistics(customer_id)
+
+        assert stats[str(customer_id)] == pytest.approx(expected), customer_id
+
+
+def test_all_users_count_matches_statistics_with_padded_domains(populated):
+    with get_session() as session:
+        session.query(User).filter(User.user_id == "u0").update(
+            {"admin_domains": " a.se , reach,"}
+        )
+
+    all_users = next(
+        group for group in group_get_all("u0", "a.se") if group["name"] == "All users"
+    )
+    stats = group_statistics_bulk(["0"], "u0", "a.se")
+
+    assert all_users["nr_users"] == stats["0"]["total_users"] == 4
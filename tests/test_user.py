@@ -0,0 +1,88 @@
+from sqlalchemy import func
+
+from db.job import job_create, job_update
+from db.models import Job, JobStatusEnum, JobType, User
+from db.session import get_session
+from db.user import (
+    user_cache,
+    user_create,
+    user_get,
+    user_get_public_key,
+    user_update,
+    users_admin_domains_from_realm,
+)
+
+
+def test_users_admin_domains_from_realm(db):
+    user_create("admin@a.se", "a.se", "u0")
+    user_create("other@a.se", "a.se", "u1")
+    user_update("u0", admin=True, admin_domains="a.se, Reach,ka.se.example")
+    user_update("u1", admin=True, admin_domains="ka.se")
+
+    def admins(realm):
+        return sorted(user["user_id"] for user in users_admin_domains_from_realm(realm))
+
+    assert admins("a.se") == ["u0"]
+    assert admins("reach") == ["u0"]
+    assert admins("ka.se") == ["u1"]
+    assert admins("se") == []
+
+    # Changing the admin domains replaces the previous ones.
+    user_update("u0", admin_domains="b.se")
+
+    assert admins("a.se") == []
+    assert admins("b.se") == ["u0"]
+
+
+def test_user_update_monthly_counters_match_jobs(db):
+    user_create("user@a.se", "a.se", "u0")
+
+    for seconds in (10.4, 20.5, 2.5, 0):
+        job = job_create(user_id="u0", job_type=JobType.TRANSCRIPTION, filename="f")
+        job = job_update(
+            job["uuid"], status=JobStatusEnum.COMPLETED, transcribed_seconds=seconds
+        )
+        user_update("u0", transcribed_seconds=seconds, job_type=job["job_type"])
+
+    # Seconds that don't belong to a transcription job are not counted.
+    user_update("u0", transcribed_seconds=60)
+
+    with get_session() as session:
+        user = session.query(User).filter(User.user_id == "u0").one()
+        seconds, files = (
+            session.query(func.sum(Job.transcribed_seconds), func.count())
+            .filter(
+                Job.user_id == "u0",
+                Job.job_type == JobType.TRANSCRIPTION,
+                Job.status == JobStatusEnum.COMPLETED,
+            )
+            .one()
+        )
+
+        assert (user.month_seconds, user.month_files) == (seconds, files) == (32, 4)
+
+
+def test_user_get_does_not_cache_access_flags(db):
+    user_create("user@a.se", "a.se", "u0")
+    user_update("u0", encryption_settings=True, encryption_password="secret")
+
+    user = user_get("u0")
+
+    assert set(user_cache.get("u0")) == {
+        "user_id",
+        "username",
+        "public_key",
+        "private_key",
+    }
+    assert user_get_public_key("u0") == user["public_key"].encode("utf-8")
+
+    # Another worker deactivating the user only changes the database, the
+    # next lookup must still see it.
+    with get_session() as session:
+        session.query(User).filter(User.user_id == "u0").update(
+            {"active": False, "admin": True}
+        )
+
+    user = user_get("u0")
+
+    assert (user["active"], user["admin"]) == (False, True)
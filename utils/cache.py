@@ -0,0 +1,77 @@
+import threading
+
+from cachetools import TTLCache
+from typing import Any, Hashable, Optional
+
+
+class Cache:
+    def __init__(self, maxsize: int, ttl: int) -> None:
+        """
+        Initialize a thread safe in-process cache where every entry
+        expires after a fixed time to live.
+
+        Parameters:
+            maxsize (int): The maximum number of entries to keep.
+            ttl (int): The time to live for each entry in seconds.
+
+        Returns:
+            None
+        """
+
+        self.__cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a value from the cache.
+
+        Parameters:
+            key (Hashable): The key to look up.
+
+        Returns:
+            Optional[Any]: The cached value, or None if missing or expired.
+        """
+
+        with self.__lock:
+            return self.__cache.get(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Parameters:
+            key (Hashable): The key to store the value under.
+            value (Any): The value to store.
+
+        Returns:
+            None
+        """
+
+        with self.__lock:
+            self.__cache[key] = value
+
+    def delete(self, *keys: Hashable) -> None:
+        """
+        Remove one or more keys from the cache.
+
+        Parameters:
+            keys (Hashable): The keys to remove.
+
+        Returns:
+            None
+        """
+
+        with self.__lock:
+            for key in keys:
+                self.__cache.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+
+        Returns:
+            None
+        """
+
+        with self.__lock:
+            self.__cache.clear()
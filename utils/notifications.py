@@ -92,10 +92,13 @@ class Notifications:
             server.starttls(context=context)
             server.login(settings.API_SMTP_USERNAME, settings.API_SMTP_PASSWORD)
 
+            # All recipients share the same connection, one mail each.
             for email in to_emails:
                 mail_to_send = f"From: Sunet Scribe <{settings.API_SMTP_SENDER}>\nTo: {email}\nSubject: {subject}\n\n{message}"
-                server.sendmail(settings.API_SMTP_SENDER, to_emails, mail_to_send)
-                logger.info(f"Email sent to {', '.join(to_emails)}")
+                server.sendmail(settings.API_SMTP_SENDER, [email], mail_to_send)
+                logger.info(f"Email sent to {email}")
+
+            server.quit()
         except Exception as e:
             logger.error(f"Error sending email to {", ".join(to_emails)}: {e}")
 
@@ -184,19 +187,22 @@ class Notifications:
             message=settings.NOTIFICATION_MAIL_TRANSCRIPTION_TO_BE_DELETED["message"],
         )
 
-    def send_new_user_created(self, to_email: str, username: str) -> None:
+    def send_new_user_created(self, to_emails: list, username: str) -> None:
         """
-        Send a new user created notification to the admin.
+        Send a new user created notification to the admins.
+        All admins are queued as one notification and sent over a single
+        SMTP connection.
 
         Parameters:
-            to_email (str): The recipient's email address.
+            to_emails (list): The recipients' email addresses.
+            username (str): The username of the new user.
 
         Returns:
             None
         """
 
         self.add(
-            to_emails=[to_email],
+            to_emails=to_emails,
             subject=settings.NOTIFICATION_MAIL_NEW_USER_CREATED["subject"],
             message=settings.NOTIFICATION_MAIL_NEW_USER_CREATED["message"].format(
                 username=username
@@ -255,6 +261,63 @@ class Notifications:
 
             return record is not None
 
+    def notification_sent_records_for(
+        self, user_ids: list, uuid: str, notification_type: str
+    ) -> set:
+        """
+        Get which of the given users already have been sent a notification.
+
+        Parameters:
+            user_ids (list): The IDs of the users to check.
+            uuid (str): The UUID of the job or entity.
+            notification_type (str): The type of notification sent.
+
+        Returns:
+            set: The IDs of the users which already have been notified.
+        """
+
+        if not user_ids:
+            return set()
+
+        with get_session() as session:
+            records = (
+                session.query(NotificationsSent.user_id)
+                .filter(NotificationsSent.user_id.in_(user_ids))
+                .filter(NotificationsSent.uuid == uuid)
+                .filter(NotificationsSent.notification_type == notification_type)
+                .all()
+            )
+
+            return {record.user_id for record in records}
+
+    def notification_sent_records_add(
+        self, user_ids: list, uuid: str, notification_type: str
+    ) -> None:
+        """
+        Record that a notification has been sent to several users at once.
+
+        Parameters:
+            user_ids (list): The IDs of the users.
+            uuid (str): The UUID of the job or entity.
+            notification_type (str): The type of notification sent.
+
+        Returns:
+            None
+        """
+
+        if not user_ids:
+            return
+
+        with get_session() as session:
+            session.add_all(
+                NotificationsSent(
+                    user_id=user_id,
+                    uuid=uuid,
+                    notification_type=notification_type,
+                )
+                for user_id in user_ids
+            )
+
     def notification_send_account_activated(self, to_email: str) -> None:
         """
         Send an account activated notification.
@@ -38,6 +38,15 @@ class Settings(BaseSettings):
     API_CLIENT_VERIFICATION_HEADER: str = "x-client-legacy"
     API_PRIVATE_KEY_PASSWORD: str = ""
 
+    # Database connection pool configuration.
+    API_DATABASE_POOL_SIZE: int = 20
+    API_DATABASE_MAX_OVERFLOW: int = 20
+
+    # In-process cache configuration.
+    API_CACHE_SIZE: int = 10000
+    API_CACHE_TTL: int = 60
+    API_STATISTICS_CACHE_TTL: int = 30
+
     # SMTP configuration.
     API_SMTP_HOST: str = ""
     API_SMTP_PORT: int = 25
@@ -33,6 +33,10 @@ class UpdateGroupRequest(BaseModel):
     quota: Optional[int] = 0
 
 
+class GroupUsersRequest(BaseModel):
+    usernames: list[str]
+
+
 class CreateCustomerRequest(BaseModel):
     customer_abbr: Optional[str] = None
     partner_id: str